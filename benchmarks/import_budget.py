@@ -0,0 +1,76 @@
+"""Import-time budget for the scraper package.
+
+Measures how long `import scrapers.base_scraper` takes, and how long importing every
+scraper module takes (as run_scrapers does), in fresh interpreters. Exits with code 1
+when either exceeds the budget and lists the slowest imports, so a heavy dependency
+pulled in at module level is caught before it reaches the nightly run.
+
+    python benchmarks/import_budget.py --budget 0.5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+ALL_SCRAPERS = (
+    "import importlib, os\n"
+    "for f in sorted(os.listdir('scrapers')):\n"
+    "    if f.endswith('.py') and f not in ('__init__.py', 'llm_functions.py'):\n"
+    "        importlib.import_module('scrapers.' + f[:-3])\n"
+)
+
+TARGETS = {
+    'scrapers.base_scraper': 'import scrapers.base_scraper',
+    'all scraper modules': ALL_SCRAPERS,
+}
+
+
+def time_code(code, repeat):
+    """Best wall-clock time of running `code` in a fresh interpreter, in seconds."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True, capture_output=True)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def slowest_imports(code, top=10):
+    """The `top` slowest imports of `code` according to python -X importtime."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, capture_output=True, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = [part.strip() for part in line[len('import time:'):].split('|')]
+        rows.append((int(cumulative), name))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import-time budget of the scraper package")
+    parser.add_argument('--budget', type=float, default=0.5, help="Maximum import time in seconds (default: 0.5)")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of runs, the best one is kept (default: 5)")
+    args = parser.parse_args()
+
+    # Interpreter startup is not part of the budget
+    baseline = time_code('pass', args.repeat)
+    failed = False
+    for name, code in TARGETS.items():
+        elapsed = time_code(code, args.repeat) - baseline
+        status = 'OK' if elapsed <= args.budget else 'OVER BUDGET'
+        print(f"{name:<24} {elapsed:.3f}s (budget {args.budget:.3f}s) {status}")
+        if elapsed > args.budget:
+            failed = True
+            for cumulative, module in slowest_imports(code):
+                print(f"    {cumulative / 1e6:8.3f}s  {module}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -80,7 +80,9 @@ class S3MacroManager:
         # print( df_unique_subset.sort_values( by=['Date'], ascending = False ) )
         new_articles_info = df_unique_subset.to_json(orient="records")
 
-        self.store_articles_index(new_articles_info)
+        # The scrapers start from these watermarks (see scrapers.macro_handler), keep them in step
+        if self.store_articles_index(new_articles_info):
+            self.store_watermarks(self._compute_watermarks(df_unique_subset))
 
     def store_articles_index(self, data):
         key = f"{self.prefix}/structure/articles_info.json"
@@ -115,7 +117,8 @@ class S3MacroManager:
 
         # Store the updated articles index
         new_articles_info = df_cleaned.to_json(orient="records")
-        self.store_articles_index(new_articles_info)
+        if self.store_articles_index(new_articles_info):
+            self.store_watermarks(self._compute_watermarks(df_cleaned))
 
     def _delete_files(self, matching_files):
         """Helper function to delete the corresponding JSON and PDF files from S3."""
@@ -139,6 +142,23 @@ class S3MacroManager:
             except Exception as e:
                 logger.warning(f"Error removing PDF file {pdf_key}: {e}")
 
+    def _compute_watermarks(self, df):
+        """Most recent article date for each organization of an articles index DataFrame."""
+        df_cleaned = df.dropna(subset=['Organization', 'Date'])
+        return df_cleaned.groupby('Organization')['Date'].max().to_dict()
+
+    def store_watermarks(self, watermarks):
+        """Store the {Organization: latest Date} watermarks next to the articles index."""
+        key = f"{self.prefix}/structure/watermarks.json"
+        content = json.dumps(watermarks, sort_keys=True)
+        try:
+            self.s3.put_object(Body=content, Bucket=self.bucket, Key=key)
+            logger.info(f"File '{key}' written successfully in {self.bucket}.")
+            return True
+        except Exception as e:
+            logger.error(f"S3FileManager::store_file Error writing file: {e}")
+            return False
+
     def get_latest_scrapping_date(self):
         """
         Returns a dictionary of the most recent article date for each organization.
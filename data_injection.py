@@ -35,8 +35,8 @@ def chunk_text(text, max_tokens=500, overlap=50):
     """
     Splits the text into chunks of max_tokens size with overlap.
     """
-    import tiktoken
-    tokenizer = tiktoken.encoding_for_model('gpt-4o-mini')
+    from scrapers.tokenizer import get_encoder
+    tokenizer = get_encoder()
 
     tokens = tokenizer.encode(text)
     chunks = []
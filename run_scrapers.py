@@ -2,17 +2,29 @@ import logging
 import os
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from multiprocessing.connection import wait
+import multiprocessing
 import argparse
 import importlib
 import shutil
-import pandas as pd
+import signal
+import threading
+import time
+from datetime import datetime, timedelta
 ############### try to solve the system path problem here
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'scrapers')))
 from scrapers.macro_handler import S3MacroManager
 from scrapers.utils import setup_logging
+from scrapers.deadline import Deadline, ScraperTimeout, set_current_deadline, reset_current_deadline
+from scrapers.async_runner import HTTP_ONLY_SCRAPERS, run_async_scrapers
+from scrapers.scheduler import ScraperHistory, plan
+from scrapers.browser_pool import configure_browser_pool, close_browser_pools
 
 logger = setup_logging('RunScrapers', level=logging.INFO)
 
+# Seconds a worker process gets past its deadline to store partial results before it is killed
+KILL_GRACE = 30
+
 def clean_tmp_directory():
     """Delete all files and folders in the tmp directory."""
     tmp_dir = os.path.join(os.getcwd(), 'tmp')
@@ -24,62 +36,316 @@ def clean_tmp_directory():
         os.makedirs(tmp_dir)
 
 
-def run_scraper_module(module_name, date, headless, overwrite):
-    """Run the scraper module with the given date and headless option."""
+def is_scraper_module(module_name):
+    """Whether scrapers.<module_name> is a scraper: it defines MyScraper and main()."""
+    try:
+        scraper_module = importlib.import_module(f'scrapers.{module_name}')
+    except Exception as e:
+        logger.error(f"Could not import scrapers.{module_name}: {e}")
+        return False
+    return callable(getattr(scraper_module, 'main', None)) and isinstance(getattr(scraper_module, 'MyScraper', None), type)
+
+
+def list_scrapers(directory, specific_scrapers=None):
+    """Return the sorted names of the scraper modules to run."""
+    # Get a list of all Python modules in the specified directory
+    scripts = [f[:-3] for f in os.listdir(directory) if f.endswith('.py') and not f.startswith('_')]
+
+    # If specific scrapers are provided, filter the scripts to run only those
+    if specific_scrapers:
+        scripts = [script for script in scripts if script in specific_scrapers]
+
+    # Helper modules sit next to the scrapers; only the modules with a scraper are run
+    scripts = [script for script in scripts if is_scraper_module(script)]
+    if specific_scrapers and not scripts:
+        logger.error(f"No valid scrapers found matching the provided names: {specific_scrapers}")
+        return []
+
+    # Sort the scripts alphabetically
+    scripts.sort()
+    return scripts
+
+
+def scraper_organization(module_name):
+    """Organization name of a scraper module, as written to the articles index."""
+    scraper_module = importlib.import_module(f'scrapers.{module_name}')
+    scraper_class = getattr(scraper_module, 'MyScraper', None)
+    return getattr(scraper_class, 'ORGANIZATION', None)
+
+
+def resolve_start_dates(scripts, watermarks, overlap_days=3):
+    """Start date of each scraper: its organization's watermark minus `overlap_days`.
+
+    Scrapers whose organization has no watermark yet start from the oldest watermark.
+    """
+    if not watermarks:
+        return {}
+    fallback = min(watermarks.values())
+    dates = {}
+    for script in scripts:
+        try:
+            organization = scraper_organization(script)
+        except Exception as e:
+            logger.warning(f"Unable to determine the organization of {script}: {e}")
+            organization = None
+        watermark = watermarks.get(organization, fallback)
+        start = datetime.strptime(watermark, '%Y-%m-%d') - timedelta(days=overlap_days)
+        dates[script] = start.strftime('%Y-%m-%d')
+        logger.info(f"Scraper {script} ({organization}): watermark {watermark}, scraping since {dates[script]}")
+    return dates
+
+
+def run_scraper_module(module_name, date, headless, overwrite, timeout=None, run_deadline=None):
+    """Run the scraper module with the given date and headless option.
+
+    The scraper must finish within `timeout` seconds and before `run_deadline`; past
+    that it is cancelled, keeps the articles processed so far and reports "Timed out".
+    Returns a result dict with the module name, its status, the number of new
+    articles and the duration in seconds.
+    """
+    if run_deadline is not None and run_deadline.expired():
+        logger.warning(f"Run deadline exceeded, skipping scraper module: {module_name}")
+        return {'module': module_name, 'status': "Skipped (run timeout)", 'articles': 0, 'duration': 0.0}
+
     logger.info(f"Running scraper module: {module_name}")
+    started = time.monotonic()
+    result = {'module': module_name, 'status': "Failed", 'articles': 0, 'duration': 0.0}
+    # The scraper picks the deadline up from this thread when it is created
+    deadline = Deadline(timeout, parent=run_deadline).start()
+    token = set_current_deadline(deadline)
     try:
         # Dynamically import the module
         scraper_module = importlib.import_module(f'scrapers.{module_name}')
         
         # Check if the module has a main function and call it with the headless option
         if hasattr(scraper_module, 'main'):
-            scraper_module.main(date_from=date, headless=headless, overwrite=overwrite)  
-            return module_name, "Success"
+            new_articles = scraper_module.main(date_from=date, headless=headless, overwrite=overwrite)
+            result['status'] = "Success"
+            result['articles'] = new_articles or 0
         else:
             logger.error(f"Module {module_name} does not have a 'main' function.")
-            return module_name, "No main function"
+            result['status'] = "No main function"
+    except ScraperTimeout:
+        pass
     except Exception as e:
-        logger.exception(f"Exception occurred while running scraper {module_name}: {e}")
-        return module_name, "Failed"
+        if not deadline.expired():
+            logger.exception(f"Exception occurred while running scraper {module_name}: {e}")
+        result['status'] = "Failed"
+    finally:
+        deadline.stop()
+        reset_current_deadline(token)
+    if deadline.expired():
+        logger.error(f"Scraper {module_name} ran past its deadline and was cancelled")
+        result['status'] = "Timed out"
+    result['duration'] = round(time.monotonic() - started, 1)
+    return result
+
+
+def run_in_threads(scripts, dates, headless, overwrite, workers, timeout=None, run_deadline=None):
+    """Run the scrapers in a thread pool and yield their results as they complete."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_scraper_module, script, dates[script], headless, overwrite, timeout, run_deadline): script for script in scripts}
+
+        for future in as_completed(futures):
+            script = futures[future]
+            try:
+                yield future.result()
+            except Exception as e:
+                logger.exception(f"Script {script} generated an exception: {e}")
+                yield {'module': script, 'status': "Exception", 'articles': 0, 'duration': 0.0}
+
+
+def _apply_resource_limits(max_memory_mb, max_cpu_seconds):
+    """Apply memory and CPU limits to the current process.
+
+    The limits are inherited by every process the worker spawns (chromedriver, Chrome).
+    RLIMIT_DATA is used rather than RLIMIT_AS because Chrome reserves far more address
+    space than it ever commits.
+    """
+    import resource
+
+    if max_memory_mb:
+        limit = int(max_memory_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
+    if max_cpu_seconds:
+        limit = int(max_cpu_seconds)
+        # The soft limit sends SIGXCPU, the hard limit a few seconds later SIGKILL
+        resource.setrlimit(resource.RLIMIT_CPU, (limit, limit + 5))
+
+
+def _process_worker(module_name, date, headless, overwrite, max_memory_mb, max_cpu_seconds, timeout, conn):
+    """Entry point of a scraper worker process."""
+    # Lead a new process group so the parent can kill the worker together with its browsers
+    os.setsid()
+    _apply_resource_limits(max_memory_mb, max_cpu_seconds)
+    result = run_scraper_module(module_name, date, headless, overwrite, timeout)
+    # Spawned workers exit without running atexit handlers
+    close_browser_pools()
+    conn.send(result)
+    conn.close()
+
+
+def _kill_process_group(process):
+    """Kill a worker and whatever it left behind (chromedriver, Chrome)."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
 
-def run_scrapers(directory, date, exclude_scripts, specific_scrapers=None, headless=True, overwrite = False):
-    """Run all or specific scrapers with the given options."""
+
+def run_in_processes(scripts, dates, headless, overwrite, workers, max_memory_mb=None, max_cpu_seconds=None, timeout=None,
+                     run_deadline=None):
+    """Run each scraper in its own worker process and yield their results as they complete.
+
+    At most `workers` processes run at a time. Each worker is limited to `max_memory_mb`
+    of memory and `max_cpu_seconds` of CPU time. A worker past its deadline (`timeout`
+    seconds, or `run_deadline`) cancels its scraper itself and is killed KILL_GRACE
+    seconds later if it is still running. A crashed or killed worker never takes the
+    runner down with it.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    pending = list(scripts)
+    running = {}
+
+    while pending or running:
+        while pending and len(running) < workers:
+            script = pending.pop(0)
+            if run_deadline is not None and run_deadline.expired():
+                logger.warning(f"Run deadline exceeded, skipping scraper module: {script}")
+                yield {'module': script, 'status': "Skipped (run timeout)", 'articles': 0, 'duration': 0.0}
+                continue
+            # Monotonic clocks are not shared with the worker, so it gets the time left instead
+            worker_timeout = Deadline(timeout, parent=run_deadline).remaining()
+            parent_conn, child_conn = ctx.Pipe(duplex=False)
+            process = ctx.Process(
+                target=_process_worker,
+                args=(script, dates[script], headless, overwrite, max_memory_mb, max_cpu_seconds, worker_timeout, child_conn),
+                name=f"scraper-{script}",
+            )
+            process.start()
+            child_conn.close()
+            running[script] = (process, parent_conn, time.monotonic(), worker_timeout)
+            logger.info(f"Started worker process {process.pid} for {script}")
+
+        if not running:
+            continue
+        waitables = [conn for _, conn, _, _ in running.values()] + [process.sentinel for process, _, _, _ in running.values()]
+        wait(waitables, timeout=1)
+
+        for script, (process, conn, started, worker_timeout) in list(running.items()):
+            elapsed = round(time.monotonic() - started, 1)
+            result = None
+            if conn.poll():
+                try:
+                    result = conn.recv()
+                except EOFError:
+                    process.join()
+                    result = {'module': script, 'status': f"Crashed (exit code {process.exitcode})", 'articles': 0, 'duration': elapsed}
+            elif not process.is_alive():
+                result = {'module': script, 'status': f"Crashed (exit code {process.exitcode})", 'articles': 0, 'duration': elapsed}
+            elif worker_timeout is not None and elapsed > worker_timeout + KILL_GRACE:
+                logger.error(f"Scraper {script} did not stop at its deadline, killing worker {process.pid}")
+                result = {'module': script, 'status': "Killed (timeout)", 'articles': 0, 'duration': elapsed}
+
+            if result is None:
+                continue
+            _kill_process_group(process)
+            process.join()
+            conn.close()
+            del running[script]
+            yield result
+
+
+def run_scrapers(directory, date, specific_scrapers=None, headless=True, overwrite = False, workers=1,
+                 mode='thread', max_memory_mb=None, max_cpu_seconds=None, timeout=None, async_http=False, run_timeout=None,
+                 skip_idle=False, max_browsers=None):
+    """Run all or specific scrapers with the given options.
+
+    Up to `workers` scrapers run at the same time, either as threads of this process
+    (mode='thread') or as isolated worker processes with resource limits (mode='process').
+    Each scraper works in its own tmp/<module> workspace, so concurrent scrapers never
+    touch each other's files. With `async_http`, the HTTP-only scrapers run together in
+    one event loop alongside the others.
+
+    Each scraper gets `timeout` seconds and the whole run `run_timeout` seconds; a
+    scraper past either deadline is cancelled and stores what it has processed so far.
+
+    In thread mode the scrapers lease their Chrome from one shared pool of warm
+    browsers, at most `max_browsers` at a time (default: one per worker).
+
+    Scrapers are started longest first, based on the durations recorded in the scraper
+    history. With `skip_idle`, scrapers that never find new articles on today's
+    weekday are skipped.
+
+    `date` is either one YYYY-MM-DD start date for every scraper or a dict with the
+    start date of each scraper module. Returns the list of result dicts.
+    """
     # Clean the tmp directory before running the scrapers
     clean_tmp_directory()
-        
-    # Get a list of all Python scripts in the specified directory
-    scripts = [f[:-3] for f in os.listdir(directory) if
-               f.endswith('.py') and f not in exclude_scripts]
 
-    # If specific scrapers are provided, filter the scripts to run only those
-    if specific_scrapers:
-        scripts = [script for script in scripts if script in specific_scrapers]
+    scripts = list_scrapers(directory, specific_scrapers)
+    if not scripts:
+        return []
 
-    # If specific scrapers are provided, filter the scripts to run only those
-    if specific_scrapers:
-        scripts = [script for script in scripts if script in specific_scrapers]
-        if not scripts:
-            logger.error(f"No valid scrapers found matching the provided names: {specific_scrapers}")
-            return
-        
-    # Sort the scripts alphabetically
-    scripts.sort()
+    started = time.monotonic()
+    history = ScraperHistory()
+    scripts, skipped = plan(scripts, history, workers, skip_idle=skip_idle)
+    configure_browser_pool(max_browsers or workers)
 
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        # Start all scripts in parallel
-        futures = {executor.submit(run_scraper_module, script, date, headless, overwrite): script for script in scripts}
-        script_status = {script: "Pending" for script in scripts}
+    if isinstance(date, dict):
+        dates = date
+    else:
+        dates = {script: date for script in scripts}
 
-        for future in as_completed(futures):
-            script_path = futures[future]
-            try:
-                script_path, status = future.result()
-                script_status[script_path] = status
-            except Exception as e:
-                script_status[script_path] = "Exception"
-                logger.exception(f"Script {script_path} generated an exception: {e}")
+    run_deadline = Deadline(run_timeout)
+    script_status = {script: "Pending" for script in scripts}
+    script_status.update({script: "Skipped (idle weekday)" for script in skipped})
+    completed = []
+
+    def record(result):
+        completed.append(result)
+        script_status[result['module']] = result['status']
+        if not result['status'].startswith("Skipped"):
+            history.record(result)
+        logger.info(f"Scraper {result['module']}: {result['status']} ({result['articles']} new articles in {result['duration']}s)")
+        logger.info(f"Script statuses: {script_status}")
 
-            logger.info(f"Script statuses: {script_status}")
+    # The HTTP-only scrapers share one event loop in a background thread
+    async_thread = None
+    async_results = []
+    if async_http:
+        async_scripts = [script for script in scripts if script in HTTP_ONLY_SCRAPERS]
+        scripts = [script for script in scripts if script not in async_scripts]
+        if async_scripts:
+            async_thread = threading.Thread(
+                target=lambda: async_results.extend(run_async_scrapers(async_scripts, dates, overwrite, timeout=timeout, run_deadline=run_deadline)),
+                name='async-scrapers',
+            )
+            async_thread.start()
+
+    if scripts:
+        workers = max(1, min(workers, len(scripts)))
+        logger.info(f"Running {len(scripts)} scrapers with {workers} {mode} worker(s)")
+
+        if mode == 'process':
+            results = run_in_processes(scripts, dates, headless, overwrite, workers,
+                                       max_memory_mb=max_memory_mb, max_cpu_seconds=max_cpu_seconds, timeout=timeout,
+                                       run_deadline=run_deadline)
+        else:
+            results = run_in_threads(scripts, dates, headless, overwrite, workers, timeout=timeout, run_deadline=run_deadline)
+
+        for result in results:
+            record(result)
+
+    if async_thread:
+        async_thread.join()
+        for result in async_results:
+            record(result)
+
+    close_browser_pools()
+    history.save()
+    logger.info(f"Run makespan: {time.monotonic() - started:.0f}s for {len(completed)} scrapers")
+    return completed
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run scraper scripts.")
@@ -87,6 +353,16 @@ if __name__ == "__main__":
     parser.add_argument('-s', '--scrapers', nargs='+', help="Specific scrapers to run (e.g., merrill, morgan_stanley)")
     parser.add_argument('--headless', action='store_true', help="Run browser in headless mode (default: False)")
     parser.add_argument('--overwrite', action='store_true', help="Reapply the process and overwrite")
+    parser.add_argument('-w', '--workers', type=int, default=1, help="Number of scrapers to run concurrently (default: 1)")
+    parser.add_argument('--mode', choices=['thread', 'process'], default='thread', help="Run scrapers as threads or as isolated worker processes (default: thread)")
+    parser.add_argument('--max-memory-mb', type=int, help="Memory limit per worker process in MB (process mode)")
+    parser.add_argument('--max-cpu-seconds', type=int, help="CPU time limit per worker process in seconds (process mode)")
+    parser.add_argument('--timeout', type=int, help="Wall-clock limit per scraper in seconds; an overrunning scraper is cancelled and keeps its partial results")
+    parser.add_argument('--run-timeout', type=int, help="Wall-clock limit for the whole run in seconds; scrapers not started by then are skipped")
+    parser.add_argument('--overlap-days', type=int, default=3, help="Without -df, re-scan this many days before each organization's latest indexed date (default: 3)")
+    parser.add_argument('--max-browsers', type=int, help="Warm Chrome instances shared by the scrapers (thread mode, default: one per worker)")
+    parser.add_argument('--skip-idle', action='store_true', help="Skip scrapers that found no new articles on their last runs on today's weekday")
+    parser.add_argument('--async-http', action='store_true', help=f"Run the HTTP-only scrapers ({', '.join(HTTP_ONLY_SCRAPERS)}) in one asyncio event loop")
     args = parser.parse_args()
 
     # Set the directory containing the scraper scripts
@@ -94,26 +370,25 @@ if __name__ == "__main__":
     sys.path.append(os.path.abspath(scrapers_directory))
 
     s3 = S3MacroManager()
-    dates = s3.get_latest_scrapping_date()
 
     if len(sys.argv) == 1:
-        x = pd.DataFrame( dates )
-        print( x )
+        for record in s3.get_latest_scrapping_date() or []:
+            print(f"{record['Organization']:<16} {record['Date']}")
         exit(0)
     # Get the date from
     if args.date_from:
         date = args.date_from
         logger.info(f"Scraping articles since {date}")
     else:
-        date = max(dates, key=lambda x: x['Date'])['Date']
-
-        logger.info(f"Scraping articles since {date}")
-        if date is None:
+        # Each scraper starts from its own organization's watermark
+        scripts = list_scrapers(scrapers_directory, args.scrapers)
+        date = resolve_start_dates(scripts, s3.get_watermarks(), overlap_days=args.overlap_days)
+        if not date:
             print("No valid date subdirectories found.")
             exit(1)
 
-    # List of scripts to exclude
-    exclude_scripts = ["__init__.py", "utils.py", "llm_functions.py", "macro_handler.py", "base_scraper.py"]
-
     # Run the scrapers (either all or specified ones) with the headless option
-    run_scrapers(scrapers_directory, date, exclude_scripts, args.scrapers, headless=args.headless, overwrite = args.overwrite)
+    run_scrapers(scrapers_directory, date, args.scrapers, headless=args.headless, overwrite = args.overwrite, workers=args.workers,
+                 mode=args.mode, max_memory_mb=args.max_memory_mb, max_cpu_seconds=args.max_cpu_seconds, timeout=args.timeout,
+                 async_http=args.async_http, run_timeout=args.run_timeout,
+                 skip_idle=args.skip_idle, max_browsers=args.max_browsers)
@@ -0,0 +1,103 @@
+import asyncio
+import importlib
+import logging
+import os
+import time
+from .utils import setup_logging
+from .deadline import Deadline, ScraperTimeout, set_current_deadline
+from .http_session import CONNECT_TIMEOUT, USER_AGENT, async_transport
+
+logger = setup_logging('AsyncRunner', level=logging.INFO)
+
+# Scrapers whose listing and downloads only need plain HTTP requests
+HTTP_ONLY_SCRAPERS = ['bis', 'fed', 'jpmorgan', 'merrill', 'troweprice']
+
+# Seconds a scraper gets past its deadline to store partial results before it is cancelled outright
+STORE_GRACE = 30
+
+
+async def _run_module(module_name, date, overwrite, http, llm, timeout=None, run_deadline=None):
+    logger.info(f"Running async scraper module: {module_name}")
+    started = time.monotonic()
+    result = {'module': module_name, 'status': "Failed", 'articles': 0, 'duration': 0.0}
+    # Every module runs in its own task, so the deadline set here is only seen by this scraper
+    deadline = Deadline(timeout, parent=run_deadline).start()
+    set_current_deadline(deadline)
+    try:
+        scraper_module = importlib.import_module(f'scrapers.{module_name}')
+        if hasattr(scraper_module, 'amain'):
+            # The scraper stops by itself at its deadline; this only catches one that does not
+            hard_limit = None if deadline.remaining() is None else deadline.remaining() + STORE_GRACE
+            new_articles = await asyncio.wait_for(
+                scraper_module.amain(date_from=date, http=http, llm=llm, overwrite=overwrite), hard_limit)
+            result['status'] = "Success"
+            result['articles'] = new_articles or 0
+        else:
+            logger.error(f"Module {module_name} does not have an 'amain' function.")
+            result['status'] = "No amain function"
+    except (ScraperTimeout, asyncio.TimeoutError):
+        pass
+    except Exception as e:
+        if not deadline.expired():
+            logger.exception(f"Exception occurred while running async scraper {module_name}: {e}")
+    finally:
+        deadline.stop()
+    if deadline.expired():
+        logger.error(f"Async scraper {module_name} ran past its deadline and was cancelled")
+        result['status'] = "Timed out"
+    result['duration'] = round(time.monotonic() - started, 1)
+    return result
+
+
+async def _run_all(module_names, dates, overwrite, timeout=None, run_deadline=None):
+    import httpx
+    from openai import AsyncOpenAI
+    from .base_scraper import LLM_TIMEOUT
+
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    http_timeout = httpx.Timeout(60.0, connect=CONNECT_TIMEOUT)
+    async with httpx.AsyncClient(headers={'User-Agent': USER_AGENT}, transport=async_transport(limits),
+                                 timeout=http_timeout, follow_redirects=True) as http:
+        # The OpenAI client shares the same connection pool, but not its 60s read timeout:
+        # summaries take as long as on the sync path
+        llm = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http, timeout=LLM_TIMEOUT)
+        return await asyncio.gather(*(_run_module(module_name, dates[module_name], overwrite, http, llm, timeout, run_deadline)
+                                      for module_name in module_names))
+
+
+async def run_scraper(make_scraper, date_from, http, llm, overwrite=False):
+    """Body of every HTTP-only scraper's amain: `make_scraper(date_from)` builds the scraper.
+
+    Loads the articles index, runs aprocess_articles on the shared clients and stores
+    the new articles. Returns their number, or None for a malformed date_from.
+    """
+    import pandas as pd
+    from datetime import datetime
+    from .macro_handler import S3MacroManager
+
+    try:
+        date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
+    except ValueError:
+        logger.error("Incorrect date format, should be YYYY-MM-DD")
+        return
+
+    articles_index_df = pd.DataFrame(await asyncio.to_thread(S3MacroManager().get_articles_index))
+
+    scraper = make_scraper(date_from)
+    new_articles = await scraper.aprocess_articles(http, llm, articles_index_df, date_from, overwrite)
+    await asyncio.to_thread(scraper.store_articles, new_articles)
+
+    scraper.logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
+
+
+def run_async_scrapers(module_names, dates, overwrite=False, timeout=None, run_deadline=None):
+    """Run the given HTTP-only scrapers concurrently in a single event loop.
+
+    `dates` maps each module to its start date. All listing fetches, PDF downloads and
+    OpenAI calls share one httpx.AsyncClient. Each scraper is cancelled after `timeout`
+    seconds or at `run_deadline`, keeping its partial results. Returns a list of result
+    dicts (module, status, articles, duration).
+    """
+    logger.info(f"Running {len(module_names)} HTTP-only scrapers in one event loop: {module_names}")
+    return asyncio.run(_run_all(module_names, dates, overwrite, timeout, run_deadline))
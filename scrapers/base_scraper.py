@@ -1,37 +1,94 @@
 from abc import ABC
+from collections import deque
+import asyncio
 import os
 import logging
-import glob
+import threading
 from .utils import setup_logging
 from .macro_handler import S3MacroManager
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from pydantic import BaseModel, Field
-from langchain_core.output_parsers import JsonOutputParser
-from selenium_stealth import stealth
-import tiktoken
+from .pipeline import Pipeline, Stage
+from .deadline import Deadline, current_deadline
+from .journal import ArticleJournal, article_key, journal_path, reached
+from .browser_pool import get_browser_pool
+from .download_tracker import DownloadTracker
+from .resource_blocking import apply_blocking_profile
+from .html_text import extract_main_text
+from .session_store import DEFAULT_MAX_AGE, SessionStore, restorable, session_path
+from .http_session import CONNECT_TIMEOUT, READ_TIMEOUT, USER_AGENT, get_http_session
+from .pdf_download import MAX_PDF_BYTES, DownloadRejected, astream_pdf, stream_pdf
+from .tokenizer import get_encoder, preload_encoder
+import base64
 import json
-from openai import OpenAI
+import time
 
-enc = tiktoken.encoding_for_model("gpt-4o-mini")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
+# selenium, langchain and openai are imported where they are used: importing them
+# costs seconds, and HTTP-only code paths never need most of them. The tokenizer is
+# shared process-wide through scrapers.tokenizer.
+_client = None
+_lazy_lock = threading.Lock()
 
+# Seconds an OpenAI request may take before it is abandoned
+LLM_TIMEOUT = 300
+
+
+def get_openai_client():
+    """Shared OpenAI client, created on first use."""
+    global _client
+    if _client is None:
+        with _lazy_lock:
+            if _client is None:
+                from openai import OpenAI
+                _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), timeout=LLM_TIMEOUT)
+    return _client
 
-from selenium.webdriver.chrome.options import Options
-from selenium import webdriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-import pickle
-import time, random
 
 logger = setup_logging('BaseScraper', level=logging.ERROR)
 
+MACRO_FILTER_PROMPT = (
+    "As a financial expert, analyze the given text to determine if it includes actionable macroeconomic insights "
+    "or tradable ideas relevant to the stock markets. Consider factors such as market trends, economic "
+    "indicators, investment opportunities, and risk assessments. "
+    "Respond with either 'yes' or 'no'.\n\n{article}\n\nRespond in 1 word with 'yes' or 'no':"
+)
+CHUNK_ANALYSIS_PROMPT = "You are a financial analyst. Extract the core content from a provided financial article, report, or expert analysis, omitting all disclaimers, copyrights, and other non-essential information. Summarize the main analysis, insights, and key conclusions, while retaining only the most informative and relevant parts.\n\n# Steps\n\n1. **Initial Reading**: Read the entire article and recognize different components within (e.g., analysis, advertisements, disclaimers, copyrights, etc.)\n2. **Identification of Content**:\n   - Identify and separate analysis and insights from non-essential information.\n   - Note and discard disclaimers, copyright notices, advertisements, or anything unrelated to financial interpretation.\n3. **Summarize Core Content**:\n   - Extract the main points, retaining the core analysis, key insights, and conclusions.\n   - Ensure the focus remains on financial insights, rationale, and associated data without extra commentary.\n4. **Conclusion Check**: Verify that core takeaways are represented clearly in a concise manner.\n\n# Output Format\n\nProvide the output as a **summary text** containing only the main analysis, key insights, and conclusions. This text should be up to **5000 words**, depending on the length and complexity of the original content.\n\n"
+CHUNK_SYNTHESIS_PROMPT = "You are a helpful assistant. You are given analyses of several chunks of a document. Your task is to create an overall analysis and summary of the document based on these chunk analyses. Focus on synthesizing the main points, insights, and conclusions. Provide your response in JSON format with the following structure:\n\n{\n  'summary': 'A concise summary of the document, up to 50 words.',\n  'cleaned_text': 'The overall cleaned text, presented as a plain narrative without nested dictionaries.'\n}"
+ARTICLE_REPORT_PROMPT = "You are a financial analyst tasked with creating an investor-focused report based on a provided financial article, report, or expert analysis. Exclude all non-essential information (e.g., disclaimers, copyright notices, advertisements) and deliver a structured, in-depth analysis that highlights core ideas, findings, and key insights relevant to investment decision-making.\n\n# Steps\n\n1. **Initial Review**: Thoroughly read the entire article, distinguishing critical financial insights, key metrics, and actionable findings from any extraneous content.\n\n2. **Investor-Focused Content Structuring**:\n   - Extract essential financial insights, metrics, data, and interpretations.\n   - Prioritize sections with high investor relevance, such as market trends, risk factors, growth opportunities, and economic impacts.\n   - Organize the content into a coherent narrative, presenting an investor-oriented analysis with practical implications.\n\n3. **Report Detailing for Investor Context**:\n   - Develop a comprehensive report highlighting key findings, relevant metrics, and any financial indicators with potential impacts on investment strategies.\n   - Clearly communicate the rationale behind insights, implications for market behavior, potential risks, and opportunities, ensuring relevance to investors.\n\n4. **Verification**:\n   - Confirm that the `cleaned_text` captures all significant insights, financial implications, and investor-relevant conclusions.\n   - Ensure the report is structured to offer a complete, coherent narrative focused on investment takeaways.\n\n# Output Format\n\nProvide your response in JSON format with the following structure:\n\n{\n  \"summary\": \"A high-level summary of the main investor takeaways, limited to 50 words.\",\n  \"cleaned_text\": \"A detailed, investor-focused report that thoroughly presents core ideas, findings, financial insights, and investment implications of the original document in a structured, narrative style,  limited to 5000 words.\"\n}\n"
+
+
 
 class BaseScraper(ABC):
-    def __init__(self, site_name, base_url, headless=False, download_dir='tmp'):
+    # Organization name written to the articles index, used to look up the scraper's watermark
+    ORGANIZATION = None
+    # Worker threads per stage of process_articles. Downloads and archiving share the
+    # single WebDriver, so they stay sequential; parsing and LLM calls run in parallel.
+    STAGE_WORKERS = {'download': 1, 'parse': 2, 'classify': 4, 'summarize': 4, 'archive': 1}
+    # Maximum number of articles waiting between two stages
+    QUEUE_SIZE = 4
+    # Maximum number of articles processed at once by aprocess_articles
+    ASYNC_CONCURRENCY = 8
+    # Browser tabs loading article pages at once, for scrapers that implement tab_url/capture_tab.
+    # The download stage takes up to this many articles at a time.
+    TAB_CONCURRENCY = 4
+    # Seconds a page load may take, and to connect and read a plain HTTP response
+    PAGE_LOAD_TIMEOUT = 60
+    HTTP_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+    # Largest PDF fetch_to_file accepts, in bytes
+    MAX_PDF_BYTES = MAX_PDF_BYTES
+    # Default timeout of the wait_for_* primitives, in seconds
+    WAIT_TIMEOUT = 20
+    # Resources the browser does not load (see scrapers.resource_blocking): on article
+    # pages, and on the listing pages read by fetch_articles (BLOCKING_PROFILE if None)
+    BLOCKING_PROFILE = 'default'
+    LISTING_BLOCKING_PROFILE = None
+    # Keep the site's cookies across runs (under state/sessions/) so that consent
+    # banners are only clicked through once every SESSION_MAX_AGE seconds
+    PERSIST_SESSION = False
+    SESSION_MAX_AGE = DEFAULT_MAX_AGE
+    # Page loaded right after the browser starts, for sites that only serve articles to a
+    # browser that went through their home page first. None: no navigation on startup.
+    WARMUP_URL = None
+
+    def __init__(self, site_name, base_url, headless=False, download_dir=None):
         self.site_name = site_name
         self.logger = setup_logging(site_name, level=logging.DEBUG)  # Changed to DEBUG level
         self.logger.debug(f"Initializing BaseScraper for {site_name}")
@@ -39,24 +96,205 @@ class BaseScraper(ABC):
         self.logger.debug(f"Base URL: {base_url}")
         self.headless = headless
         self.logger.debug(f"Headless mode: {headless}")
-        self.download_dir = os.path.join(os.getcwd(), download_dir)
+        # Every scraper gets its own workspace under tmp/ so that concurrent runs never
+        # share a download directory.
+        self.workspace = os.path.join(os.getcwd(), 'tmp', self.workspace_name())
+        self.logger.debug(f"Workspace: {self.workspace}")
+        if download_dir:
+            self.download_dir = os.path.join(os.getcwd(), download_dir)
+        else:
+            self.download_dir = os.path.join(self.workspace, 'downloads')
         self.logger.debug(f"Download directory: {self.download_dir}")
         self.s3 = S3MacroManager()
         self.logger.debug("S3MacroManager initialized")
+        os.makedirs(self.workspace, exist_ok=True)
         os.makedirs(self.download_dir, exist_ok=True)
         self.logger.debug(f"Created download directory: {self.download_dir}")
-        self.driver = None
-        self.cookies_file = f'{site_name}_cookies.pkl'
-        self.logger.debug(f"Cookies file: {self.cookies_file}")
-        # Remove cookies if they exist
-        self.remove_cookies()
-        self.logger.debug("Cookies removed (if existed)")
+        # Leased on first use of self.driver, so HTTP-only runs never start Chrome
+        self._driver = None
+        self._start_lock = threading.RLock()
+        # Held by whichever stage is using the WebDriver (download or archive)
+        self._driver_lock = threading.Lock()
+        self.blocking_profile = self.BLOCKING_PROFILE
+        self.session = SessionStore(session_path(self.workspace_name()), self.SESSION_MAX_AGE) if self.PERSIST_SESSION else None
+        self._consent = False
+        # Deadline set by run_scrapers for the scraper running in this thread (or task);
+        # when it expires the watchdog quits the browser to unblock any pending call.
+        self.deadline = current_deadline() or Deadline()
+        self.deadline.on_expire(self._cancel)
+        # Stages completed by each article, so that an interrupted run resumes where it stopped
+        self.journal = ArticleJournal(journal_path(self.workspace_name()), s3=self.s3)
+
+    def workspace_name(self):
+        """Name of the scraper workspace, taken from the scraper module (e.g. 'bis', 'bis_new')."""
+        module_name = self.__class__.__module__.rsplit('.', 1)[-1]
+        if module_name == '__main__':
+            return self.site_name
+        return module_name
+
+    def download_path(self, file_name):
+        """Absolute path of a file inside this scraper's download directory."""
+        return os.path.join(self.download_dir, file_name)
+
+    def check_deadline(self):
+        """Raise ScraperTimeout if the scraper has run past its deadline."""
+        self.deadline.check()
+
+    def sleep(self, seconds):
+        """Sleep that is cut short, with ScraperTimeout, when the deadline expires."""
+        self.deadline.sleep(seconds)
+
+    def wait_until(self, condition, timeout=None, poll_interval=0.1):
+        """Call `condition` until it returns a truthy value, and return that value.
+
+        Returns None after `timeout` seconds (WAIT_TIMEOUT by default). Exceptions raised
+        by `condition` count as not met yet, e.g. while a page is navigating.
+        """
+        timeout = self.WAIT_TIMEOUT if timeout is None else timeout
+        end = time.monotonic() + timeout
+        while True:
+            try:
+                value = condition()
+            except Exception:
+                value = None
+            if value:
+                return value
+            if time.monotonic() >= end:
+                return None
+            self.sleep(poll_interval)
+
+    def wait_for_document_ready(self, timeout=None):
+        """Wait until the current page has finished loading. Returns False on timeout."""
+        ready = self.wait_until(lambda: self.driver.execute_script("return document.readyState") == 'complete', timeout)
+        if not ready:
+            self.logger.warning(f"Page not ready after {timeout or self.WAIT_TIMEOUT}s: {self.driver.current_url}")
+        return bool(ready)
+
+    def wait_for_network_idle(self, idle_time=0.5, timeout=None):
+        """Wait until the page is loaded and has fetched no new resource for `idle_time` seconds.
+
+        Covers pages that render their content with scripts after the load event.
+        Returns False on timeout.
+        """
+        # The resource timing buffer holds 250 entries by default; once full, the count stops growing
+        script = (
+            "performance.setResourceTimingBufferSize(100000);"
+            "return document.readyState === 'complete' ? performance.getEntriesByType('resource').length : -1;"
+        )
+        state = {'count': None, 'since': time.monotonic()}
+
+        def idle():
+            count = self.driver.execute_script(script)
+            now = time.monotonic()
+            if count != state['count']:
+                state.update(count=count, since=now)
+                return False
+            return count >= 0 and now - state['since'] >= idle_time
+
+        if not self.wait_until(idle, timeout):
+            self.logger.warning(f"Network not idle after {timeout or self.WAIT_TIMEOUT}s: {self.driver.current_url}")
+            return False
+        return True
+
+    def wait_for_element(self, by, value, timeout=None, condition='present'):
+        """Wait for an element to be 'present', 'visible' or 'clickable', and return it.
+
+        Raises selenium's TimeoutException if it does not show up in time.
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        expected = {
+            'present': EC.presence_of_element_located,
+            'visible': EC.visibility_of_element_located,
+            'clickable': EC.element_to_be_clickable,
+        }[condition]
+        timeout = self.WAIT_TIMEOUT if timeout is None else timeout
+        remaining = self.deadline.remaining()
+        if remaining is not None:
+            timeout = min(timeout, remaining)
+        return WebDriverWait(self.driver, timeout).until(expected((by, value)))
+
+    def track_download(self):
+        """Redirect the browser's next download to a directory of its own.
+
+        Use as `with self.track_download() as download:`, trigger the download inside
+        the block, then wait_for_download(download) and download.save_as(...).
+        """
+        return DownloadTracker(self.driver, self.download_dir)
+
+    def wait_for_download(self, download, timeout=None):
+        """Wait for the download tracked by `download` to finish.
+
+        Returns the exact path of the downloaded file as soon as Chrome has finished
+        writing it, or None on timeout.
+        """
+        path = self.wait_until(download.finished_file, timeout, poll_interval=0.2)
+        if not path:
+            self.logger.warning(f"Download not finished after {timeout or self.WAIT_TIMEOUT}s")
+        return path
+
+    def capture_pdf(self, file_name, chunk_size=1 << 20):
+        """Print the current page to the article's file and return its path.
+
+        The PDF is streamed from Chrome (transferMode ReturnAsStream) and written in
+        chunks of `chunk_size` bytes, so it is never held in memory as one base64
+        string. The file only appears under its final name once complete.
+        """
+        result = self.driver.execute_cdp_cmd("Page.printToPDF", {
+            "landscape": False,
+            "displayHeaderFooter": False,
+            "printBackground": True,
+            "preferCSSPageSize": True,
+            "transferMode": "ReturnAsStream",
+        })
+        stream = result['stream']
+        path = self.download_path(file_name)
+        partial_path = f"{path}.part"
+        try:
+            with open(partial_path, 'wb') as f:
+                while True:
+                    chunk = self.driver.execute_cdp_cmd("IO.read", {"handle": stream, "size": chunk_size})
+                    if chunk.get('base64Encoded'):
+                        f.write(base64.b64decode(chunk['data']))
+                    else:
+                        f.write(chunk['data'].encode())
+                    if chunk.get('eof'):
+                        break
+        except BaseException:
+            # A failed read leaves no truncated print behind
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+        finally:
+            self.driver.execute_cdp_cmd("IO.close", {"handle": stream})
+        os.replace(partial_path, path)
+        return path
+
+    def set_blocking_profile(self, profile):
+        """Switch the blocking profile, applied right away if the browser is started."""
+        self.blocking_profile = profile
+        if self._driver:
+            apply_blocking_profile(self._driver, profile)
+
+    def _cancel(self):
+        """Watchdog callback: quit the browser so blocked WebDriver calls fail right away."""
+        driver, self._driver = self._driver, None
+        if driver:
+            self.logger.warning("Deadline exceeded, quitting the browser")
+            get_browser_pool(self.headless).discard(driver)
 
     def remove_cookies(self):
-        if os.path.exists(self.cookies_file):
-            os.remove(self.cookies_file)
+        """Forget the persisted session and the browser's cookies, so the consent steps show up again."""
+        if self.session:
+            self.session.clear()
+        if self._driver:
+            self._driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        self._consent = False
 
     def get_driver_options(self):
+        from selenium.webdriver.chrome.options import Options
+
         options = Options()
         if self.headless:
             options.add_argument('--headless=new')  # Updated headless argument
@@ -72,7 +310,7 @@ class BaseScraper(ABC):
         options.add_argument('--ignore-ssl-errors')
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_argument('--start-maximized')
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36')  # Add realistic user agent
+        options.add_argument(f'user-agent={USER_AGENT}')  # Add realistic user agent, the same as plain HTTP requests
         options.add_argument('--referrer=https://www.google.com')  # Add referrer to appear as if coming from Google
 
 
@@ -89,69 +327,99 @@ class BaseScraper(ABC):
         options.add_experimental_option('useAutomationExtension', False)
         return options
 
+    def launch_browser(self):
+        """Launch a new stealth-configured Chrome. Used by the browser pool when no warm browser is idle."""
+        from selenium import webdriver
+        from selenium_stealth import stealth
+
+        self.logger.debug("No idle browser in the pool, creating new instance")
+        driver = webdriver.Chrome(options=self.get_driver_options())
+
+        # Add stealth configuration
+        stealth(driver,
+            languages=["en-US", "en"],
+            vendor="Google Inc.",
+            platform="Win32",
+            webgl_vendor="Intel Inc.",
+            renderer="Intel Iris OpenGL Engine",
+            fix_hairline=True,
+        )
+
+        self.logger.debug("WebDriver instance created with stealth configuration")
+        return driver
+
+    @property
+    def http(self):
+        """Pooled requests.Session shared by all scrapers, with retries and keep-alive (see scrapers.http_session)."""
+        return get_http_session()
+
+    @property
+    def driver(self):
+        """The scraper's WebDriver, leased from the browser pool on first access."""
+        if self._driver is None:
+            self.start_browser()
+        return self._driver
+
+    @driver.setter
+    def driver(self, driver):
+        self._driver = driver
+
     def start_browser(self):
-        """Start the Selenium WebDriver if not already started."""
-        self.logger.debug("Starting browser")
-        if not self.driver:
-            self.logger.debug("WebDriver not initialized, creating new instance")
-            self.driver = webdriver.Chrome(options=self.get_driver_options())
-            
-            # Add stealth configuration
-            stealth(self.driver,
-                languages=["en-US", "en"],
-                vendor="Google Inc.",
-                platform="Win32",
-                webgl_vendor="Intel Inc.",
-                renderer="Intel Iris OpenGL Engine",
-                fix_hairline=True,
-            )
-            
-            self.logger.debug("WebDriver instance created with stealth configuration")
-               
-            # Load cookies before navigating to the base URL
-            self.logger.debug("Attempting to load cookies")
-            cookies_loaded = self.load_cookies()
-
-            if not cookies_loaded:
-                self.logger.debug("No cookies loaded, navigating directly to base URL")
-                # No cookies were loaded, navigate to the base URL directly
-                self.driver.get(self.base_url)
-                self.logger.debug(f"Navigated to {self.base_url}")
-            else:
-                self.logger.debug("Cookies loaded, reloading page to apply them")
-                # Cookies were loaded, reload the page to apply them
-                self.driver.get(self.base_url)  # Load the base URL first
-                self.logger.debug(f"Loaded base URL: {self.base_url}")
-                self.driver.refresh()  # Refresh to ensure cookies are applied
-                self.logger.debug("Page refreshed to apply cookies")
-        else:
-            self.logger.debug("WebDriver already initialized")
+        """Lease a warm WebDriver from the browser pool if not already started.
+
+        Called on first access of self.driver; scrapers do not need to call it.
+        """
+        with self._start_lock:
+            self.check_deadline()
+            if self._driver:
+                return
+            self.logger.debug("Starting browser")
+            self._driver = get_browser_pool(self.headless).acquire(self.download_dir, self.launch_browser, self.deadline)
+            self._driver.set_page_load_timeout(self.PAGE_LOAD_TIMEOUT)
+            apply_blocking_profile(self._driver, self.blocking_profile)
+            self.logger.debug("WebDriver leased from the browser pool")
+
+            # Cookies are set through CDP, they apply to the first page the scraper loads
+            self.load_cookies()
+            if self.WARMUP_URL:
+                self._driver.get(self.WARMUP_URL)
+                self.logger.debug(f"Navigated to {self.WARMUP_URL}")
 
     def close_browser(self):
-        """Close the Selenium WebDriver if open."""
-        if self.driver:
-            self.save_cookies()  # Save cookies before quitting
-            self.driver.quit()
-            self.driver = None
-            self.remove_cookies()
+        """Return the Selenium WebDriver to the browser pool if open."""
+        if self._driver:
+            driver = self._driver
+            self.save_cookies()  # Save cookies before releasing
+            self._driver = None
+            get_browser_pool(self.headless).release(driver)
 
     def save_cookies(self):
-        """Save cookies to a file."""
-        if self.driver:
-            cookies = self.driver.get_cookies()
-            with open(self.cookies_file, 'wb') as f:
-                pickle.dump(cookies, f)
+        """Persist the cookies of every domain the browser visited, with PERSIST_SESSION."""
+        if self.session and self._driver:
+            try:
+                cookies = self._driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+                self.session.save(cookies, consent=self._consent)
+            except Exception as e:
+                self.logger.warning(f"Unable to save session: {e}")
 
     def load_cookies(self):
-        """Load cookies from a file if they exist. Returns True if cookies were loaded, False otherwise."""
-        if os.path.exists(self.cookies_file):
-            with open(self.cookies_file, 'rb') as f:
-                cookies = pickle.load(f)
-                for cookie in cookies:
-                    self.driver.add_cookie(cookie)
-            self.logger.info(f"Loaded cookies from {self.cookies_file}.")
-            return True
-        return False
+        """Restore the persisted session into the browser. Returns True if cookies were loaded, False otherwise."""
+        session = self.session.load() if self.session else None
+        if not session:
+            return False
+        self._driver.execute_cdp_cmd('Network.setCookies', {'cookies': restorable(session['cookies'])})
+        self._consent = session.get('consent', False)
+        self.logger.info(f"Restored session from {self.session.path} (consent {'given' if self._consent else 'not given'})")
+        return True
+
+    def has_consent(self):
+        """True if the restored session already went through the site's consent steps."""
+        return self._consent
+
+    def record_consent(self):
+        """Note that the consent steps were clicked through, and persist the session right away."""
+        self._consent = True
+        self.save_cookies()
     
     def fetch_articles(self):
         """Fetch articles from the website. To be implemented by child classes."""
@@ -161,63 +429,216 @@ class BaseScraper(ABC):
         """Extract and return necessary information from a single article."""
         pass
 
-    def download_pdf(self, article_info):
-        pass
+    def fetch_article_html(self, article_info):
+        """HTML of an article published as a web page, or None for a PDF article.
+
+        Scrapers of HTML articles override it (usually with fetch_html) to get the text
+        straight from the page; the PDF is then only printed for articles worth archiving.
+        """
+        return None
 
-    def rename_downloaded_file(self, new_filename):
-        list_of_files = glob.glob(os.path.join(self.download_dir, '*'))
-        if not list_of_files:
-            self.logger.error(f"No files found in {self.download_dir} to rename.")
+    def fetch_html(self, url):
+        """Fetch a page over plain HTTP and return its HTML, or None on failure."""
+        response = self.http.get(url, timeout=self.HTTP_TIMEOUT)
+        if response.status_code != 200:
+            self.logger.warning(f"Failed to fetch {url}: status code {response.status_code}")
             return None
-        latest_file = max(list_of_files, key=os.path.getctime)
+        return response.text
+
+    def extract_article_text(self, article_info):
+        """Main text of an HTML article, read from the page without printing it, or None.
+
+        None sends the article through download_pdf and the PDF parser, as for PDF articles.
+        """
         try:
-            new_filepath = os.path.join(self.download_dir, new_filename)
-            os.rename(latest_file, new_filepath)
-            return new_filename
+            html = self.fetch_article_html(article_info)
         except Exception as e:
-            self.logger.error(f"Failed to rename {latest_file} to {new_filename}: {e}")
+            self.logger.warning(f"Unable to fetch the page of '{article_info['Title']}': {e}")
             return None
+        if not html:
+            return None
+        text = extract_main_text(html)
+        if not text:
+            self.logger.info(f"No article text found in the page of '{article_info['Title']}', printing it instead")
+        return text
+
+    def fetch_to_file(self, url, file_name):
+        """Stream the PDF at `url` into the download directory. Returns True on success.
+
+        See scrapers.pdf_download: the PDF is written in chunks and hashed on the way,
+        responses that are not PDFs or exceed MAX_PDF_BYTES are aborted early, and an
+        unchanged PDF downloaded by a previous run is copied from the HTTP cache.
+        """
+        try:
+            download = stream_pdf(self.http, url, self.download_path(file_name), self.HTTP_TIMEOUT, self.MAX_PDF_BYTES)
+        except DownloadRejected as e:
+            self.logger.warning(str(e))
+            return False
+        self.logger.debug(f"Downloaded {url} ({download.size} bytes, sha256 {download.sha256}{', cached' if download.from_cache else ''})")
+        return True
+
+    def download_pdf(self, article_info):
+        pass
+
+    def tab_url(self, article_info):
+        """Page to load in a browser tab of its own to capture the article, or None.
+
+        Scrapers whose articles are captured from a rendered page (printed, or a PDF
+        link clicked) override it together with capture_tab; the pages of several
+        articles then load in parallel tabs of the one browser. With None the
+        article goes through download_pdf.
+        """
+        return None
+
+    def capture_tab(self, article_info):
+        """Capture the article from the current tab, where tab_url(article_info) was loaded.
+
+        Returns True once the article's file is written.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} has a tab_url but no capture_tab")
+
+    def download_pdfs(self, article_infos):
+        """Download the files of several articles, yielding (article_info, downloaded) as each completes.
+
+        The WebDriver lock is taken around each use of the browser and never held
+        across a yield, so the caller must not hold it.
+        """
+        in_tabs = []
+        for article_info in article_infos:
+            if self.TAB_CONCURRENCY > 1 and self.tab_url(article_info):
+                in_tabs.append(article_info)
+                continue
+            try:
+                with self._driver_lock:
+                    downloaded = self.download_pdf(article_info)
+            except Exception as e:
+                self.logger.error(f"Error downloading '{article_info['Title']}': {e}")
+                downloaded = False
+            yield article_info, downloaded
+        if in_tabs:
+            yield from self._download_in_tabs(in_tabs)
+
+    def _download_in_tabs(self, article_infos):
+        """Load the articles in up to TAB_CONCURRENCY tabs and capture each one as soon as its page is loaded.
+
+        Each use of the browser holds the WebDriver lock and leaves the home window
+        current, so the archive stage can use the browser while the tabs load.
+        """
+        with self._driver_lock:
+            driver = self.driver
+            home = driver.current_window_handle
+        pending = deque(article_infos)
+        tabs = {}  # window handle -> (article_info, opened at)
+
+        def loaded_tab():
+            with self._driver_lock:
+                try:
+                    return self._loaded_tab(tabs)
+                finally:
+                    driver.switch_to.window(home)
+
+        try:
+            while pending or tabs:
+                while pending and len(tabs) < self.TAB_CONCURRENCY:
+                    self.check_deadline()
+                    article_info = pending.popleft()
+                    with self._driver_lock:
+                        handle = self._open_tab(self.tab_url(article_info))
+                        driver.switch_to.window(home)
+                    tabs[handle] = (article_info, time.monotonic())
+
+                handle = self.wait_until(loaded_tab, timeout=self.PAGE_LOAD_TIMEOUT + 1)
+                if handle is None:
+                    handle = min(tabs, key=lambda h: tabs[h][1])
+                article_info, opened_at = tabs.pop(handle)
+                self.logger.debug(f"Page of '{article_info['Title']}' loaded in {time.monotonic() - opened_at:.1f}s")
+                with self._driver_lock:
+                    driver.switch_to.window(handle)
+                    try:
+                        downloaded = self.capture_tab(article_info)
+                    except Exception as e:
+                        self.logger.error(f"Error capturing '{article_info['Title']}': {e}")
+                        downloaded = False
+                    finally:
+                        driver.close()
+                        # The closed tab was the current window: new tabs are opened from home
+                        driver.switch_to.window(home)
+                yield article_info, downloaded
+        finally:
+            # Tabs left behind when the deadline expires or the consumer stops early
+            with self._driver_lock:
+                for handle in tabs:
+                    try:
+                        driver.switch_to.window(handle)
+                        driver.close()
+                    except Exception:
+                        pass
+                try:
+                    driver.switch_to.window(home)
+                except Exception:
+                    pass
+
+    def _open_tab(self, url):
+        """Open `url` in a new tab without waiting for it to load. Returns the tab's window handle."""
+        self.driver.switch_to.new_window('tab')
+        # Blocked URLs are set per tab
+        apply_blocking_profile(self.driver, self.blocking_profile)
+        self.driver.execute_script("window.location.href = arguments[0];", url)
+        return self.driver.current_window_handle
+
+    def _loaded_tab(self, tabs):
+        """Handle of a tab whose page has loaded (or timed out), else None."""
+        for handle, (article_info, opened_at) in tabs.items():
+            if time.monotonic() - opened_at >= self.PAGE_LOAD_TIMEOUT:
+                self.logger.warning(f"Page of '{article_info['Title']}' still loading after {self.PAGE_LOAD_TIMEOUT}s")
+                return handle
+            self.driver.switch_to.window(handle)
+            if self.driver.execute_script("return document.readyState") == 'complete' and self.driver.current_url != 'about:blank':
+                return handle
+        return None
+
+    def _macro_filter_text(self, text):
+        """Keep the first part of the text that fits in the gpt model."""
+        tokenizer = get_encoder()
+        tokens = tokenizer.encode(text)
+        end = min(125000, len(tokens))
+        return tokenizer.decode(tokens[:end])
+
+    def _log_macro_verdict(self, ismacro):
+        if ismacro == 'yes':
+            self.logger.info(f"Article is macro: {ismacro}")
+            return True
+        else:
+            self.logger.info(f"Article is not macro: {ismacro}")
+            return False
 
     def isMacro(self, text):
-            # Initialize tokenizer
-            tokenizer = enc  # Tiktoken tokenizer initialized earlier
-            # Tokenize the text
-            tokens = tokenizer.encode(text)
-            total_tokens = len(tokens)
+            from langchain.prompts import PromptTemplate
+            from langchain_openai import ChatOpenAI
 
-            # keep the first part of the text that fits in the gpt model
-            end = min(125000, total_tokens)
-            chunk = tokens[:end]
-            chunk_text = tokenizer.decode(chunk)
-            params = {'filter_macro': {
-            'prompt': (
-                "As a financial expert, analyze the given text to determine if it includes actionable macroeconomic insights "
-                "or tradable ideas relevant to the stock markets. Consider factors such as market trends, economic "
-                "indicators, investment opportunities, and risk assessments. "
-                "Respond with either 'yes' or 'no'.\n\n{article}\n\nRespond in 1 word with 'yes' or 'no':"
-            ),
-            'model': 'gpt-4o-mini',
-            'inputs': ['article']},
-            }
+            chunk_text = self._macro_filter_text(text)
 
             # Create the PromptTemplate with the provided input variables
-            input_prompt = PromptTemplate(template=params['filter_macro']['prompt'], input_variables=params['filter_macro']['inputs'])
+            input_prompt = PromptTemplate(template=MACRO_FILTER_PROMPT, input_variables=['article'])
 
             # Create the ChatOpenAI instance
-            llm = ChatOpenAI(temperature=0, model_name=params['filter_macro']['model'], max_tokens=5, openai_api_key=os.getenv("OPENAI_API_KEY"))
+            llm = ChatOpenAI(temperature=0, model_name='gpt-4o-mini', max_tokens=5, openai_api_key=os.getenv("OPENAI_API_KEY"), timeout=LLM_TIMEOUT)
 
             # Chain for the OpenAI call
             chain = input_prompt | llm
             ismacro = chain.invoke({'article': chunk_text}).content.lower()
-            if ismacro == 'yes':
-                self.logger.info(f"Article is macro: {ismacro}")
-                return True
-            else:
-                self.logger.info(f"Article is not macro: {ismacro}")
-                return False
-        
-    def get_content_and_summary(self, article_info):
-        """Process the downloaded PDF, extract content, and summarize it."""
+            return self._log_macro_verdict(ismacro)
+
+    async def aisMacro(self, llm, text):
+        """Async variant of isMacro using the shared AsyncOpenAI client `llm`."""
+        chunk_text = self._macro_filter_text(text)
+        messages = [{"role": "user", "content": MACRO_FILTER_PROMPT.format(article=chunk_text)}]
+        response = await llm.chat.completions.create(model='gpt-4o-mini', messages=messages, temperature=0, max_tokens=5)
+        ismacro = response.choices[0].message.content.lower()
+        return self._log_macro_verdict(ismacro)
+
+    def read_pdf_content(self, article_info):
+        """Extract the text of the downloaded PDF, or None if it cannot be read."""
         file_name = article_info['file_name']
         pdf_path = os.path.join(self.download_dir, file_name)
 
@@ -226,6 +647,8 @@ class BaseScraper(ABC):
             return None
 
         try:
+            from langchain_community.document_loaders import PyPDFLoader
+
             loader = PyPDFLoader(pdf_path)
             pages = loader.load_and_split()
 
@@ -233,22 +656,51 @@ class BaseScraper(ABC):
                 self.logger.error(f"Failed to read pages from PDF: {file_name}")
                 return None
 
-            content = ' '.join([page.page_content for page in pages])
-            
-            if self.isMacro( content ):
-                clean_content = self.clean_article(content)
-                if clean_content:
-                    return clean_content
-                else:
-                    self.logger.error(f"Error cleaning article: {file_name}")
-                    return None
-            else:
-                self.logger.warning(f"{file_name} is not consider Macro document, pass")                 
+            return ' '.join([page.page_content for page in pages])
 
         except Exception as e:
             self.logger.error(f"Error reading PDF file {file_name}: {e}")
             return None
 
+    def get_content_and_summary(self, article_info):
+        """Process the downloaded PDF, extract content, and summarize it."""
+        file_name = article_info['file_name']
+        content = self.read_pdf_content(article_info)
+        if not content:
+            return None
+
+        if self.isMacro( content ):
+            clean_content = self.clean_article(content)
+            if clean_content:
+                return clean_content
+            else:
+                self.logger.error(f"Error cleaning article: {file_name}")
+                return None
+        else:
+            self.logger.warning(f"{file_name} is not consider Macro document, pass")
+
+    @staticmethod
+    def _messages(system_prompt, text):
+        return [
+            {"role": "system", "content": [{"type": "text", "text": system_prompt}]},
+            {"role": "user", "content": [{"type": "text", "text": text}]},
+        ]
+
+    @staticmethod
+    def _split_tokens(tokens, max_chunk_tokens, overlap_tokens):
+        """Split tokens into chunks of max_chunk_tokens with overlap."""
+        chunks = []
+        start = 0
+        while start < len(tokens):
+            end = min(start + max_chunk_tokens, len(tokens))
+            chunks.append(tokens[start:end])
+            start += max_chunk_tokens - overlap_tokens  # Move start forward
+        return chunks
+
+    @staticmethod
+    def _join_chunk_analyses(analyses):
+        return "\n\n".join([f"Analysis of chunk {idx+1}:\n{analysis}" for idx, analysis in enumerate(analyses)])
+
     def clean_article(self, text, max_chunk_tokens=30000, overlap_tokens=200):
 
         if not text:
@@ -257,71 +709,62 @@ class BaseScraper(ABC):
 
         try:
             # Initialize tokenizer
-            tokenizer = enc  # Tiktoken tokenizer initialized earlier
+            tokenizer = get_encoder()
             tokens = tokenizer.encode(text)
             total_tokens = len(tokens)
 
             if total_tokens > max_chunk_tokens:
-                # Split tokens into chunks with overlap
-                chunks = []
-                start = 0
-                while start < total_tokens:
-                    end = min(start + max_chunk_tokens, total_tokens)
-                    chunk_tokens = tokens[start:end]
-                    chunks.append(chunk_tokens)
-                    start += max_chunk_tokens - overlap_tokens  # Move start forward
-
                 # Process each chunk
                 analyses = []
-                for idx, chunk_tokens in enumerate(chunks):
-                    chunk_text = tokenizer.decode(chunk_tokens)
-
-                    messages=[{
-                            "role": "system",
-                            "content": [
-                                { "type": "text",
-                                  "text": "You are a financial analyst. Extract the core content from a provided financial article, report, or expert analysis, omitting all disclaimers, copyrights, and other non-essential information. Summarize the main analysis, insights, and key conclusions, while retaining only the most informative and relevant parts.\n\n# Steps\n\n1. **Initial Reading**: Read the entire article and recognize different components within (e.g., analysis, advertisements, disclaimers, copyrights, etc.)\n2. **Identification of Content**:\n   - Identify and separate analysis and insights from non-essential information.\n   - Note and discard disclaimers, copyright notices, advertisements, or anything unrelated to financial interpretation.\n3. **Summarize Core Content**:\n   - Extract the main points, retaining the core analysis, key insights, and conclusions.\n   - Ensure the focus remains on financial insights, rationale, and associated data without extra commentary.\n4. **Conclusion Check**: Verify that core takeaways are represented clearly in a concise manner.\n\n# Output Format\n\nProvide the output as a **summary text** containing only the main analysis, key insights, and conclusions. This text should be up to **5000 words**, depending on the length and complexity of the original content.\n\n"
-                                }]
-                        },
-                        {
-                            "role": "user",
-                            "content": [{"type": "text", "text": chunk_text}]
-                        }]
-
+                for chunk_tokens in self._split_tokens(tokens, max_chunk_tokens, overlap_tokens):
+                    messages = self._messages(CHUNK_ANALYSIS_PROMPT, tokenizer.decode(chunk_tokens))
                     # Make the API call for the chunk
-                    response = client.chat.completions.create(model='gpt-4o-mini',messages=messages,temperature=0, max_tokens=4000)
+                    response = get_openai_client().chat.completions.create(model='gpt-4o-mini',messages=messages,temperature=0, max_tokens=4000)
                     # Extract the response content
-                    result = response.choices[0].message.content
-                    analyses.append(result)
-
-                # Combine the analyses into a text to feed into the overall analysis
-                chunk_analyses_text = "\n\n".join([f"Analysis of chunk {idx+1}:\n{analysis}" for idx, analysis in enumerate(analyses)])
+                    analyses.append(response.choices[0].message.content)
 
                 # Now, create a new prompt to produce the overall analysis
-                messages=[
-                    {"role": "system", "content": [{"type": "text","text": "You are a helpful assistant. You are given analyses of several chunks of a document. Your task is to create an overall analysis and summary of the document based on these chunk analyses. Focus on synthesizing the main points, insights, and conclusions. Provide your response in JSON format with the following structure:\n\n{\n  'summary': 'A concise summary of the document, up to 50 words.',\n  'cleaned_text': 'The overall cleaned text, presented as a plain narrative without nested dictionaries.'\n}"}]},
-                    {"role": "user", "content": [{"type": "text","text": chunk_analyses_text}]}
-                    ]
-                
-                response = client.chat.completions.create(model='gpt-4o-mini',messages=messages,temperature=0, max_tokens=8000, response_format={"type": "json_object"})
+                messages = self._messages(CHUNK_SYNTHESIS_PROMPT, self._join_chunk_analyses(analyses))
+                response = get_openai_client().chat.completions.create(model='gpt-4o-mini',messages=messages,temperature=0, max_tokens=8000, response_format={"type": "json_object"})
                 result = json.loads(response.choices[0].message.content)
-                print(f"\n\ntype(result): {type(result)}\n\n")
-                print(result)
                 return result
             else:
                 # Directly process the text if within token limit
-                messages=[
-                    {"role": "system", "content": [{"type": "text", "text": "You are a financial analyst tasked with creating an investor-focused report based on a provided financial article, report, or expert analysis. Exclude all non-essential information (e.g., disclaimers, copyright notices, advertisements) and deliver a structured, in-depth analysis that highlights core ideas, findings, and key insights relevant to investment decision-making.\n\n# Steps\n\n1. **Initial Review**: Thoroughly read the entire article, distinguishing critical financial insights, key metrics, and actionable findings from any extraneous content.\n\n2. **Investor-Focused Content Structuring**:\n   - Extract essential financial insights, metrics, data, and interpretations.\n   - Prioritize sections with high investor relevance, such as market trends, risk factors, growth opportunities, and economic impacts.\n   - Organize the content into a coherent narrative, presenting an investor-oriented analysis with practical implications.\n\n3. **Report Detailing for Investor Context**:\n   - Develop a comprehensive report highlighting key findings, relevant metrics, and any financial indicators with potential impacts on investment strategies.\n   - Clearly communicate the rationale behind insights, implications for market behavior, potential risks, and opportunities, ensuring relevance to investors.\n\n4. **Verification**:\n   - Confirm that the `cleaned_text` captures all significant insights, financial implications, and investor-relevant conclusions.\n   - Ensure the report is structured to offer a complete, coherent narrative focused on investment takeaways.\n\n# Output Format\n\nProvide your response in JSON format with the following structure:\n\n{\n  \"summary\": \"A high-level summary of the main investor takeaways, limited to 50 words.\",\n  \"cleaned_text\": \"A detailed, investor-focused report that thoroughly presents core ideas, findings, financial insights, and investment implications of the original document in a structured, narrative style,  limited to 5000 words.\"\n}\n"}]},
-                    {"role": "user", "content": [{"type": "text","text": text}]}
-                    ]
-                
-                response = client.chat.completions.create(model='gpt-4o-mini',messages=messages,temperature=0, max_tokens=6000, response_format={"type": "json_object"})
+                messages = self._messages(ARTICLE_REPORT_PROMPT, text)
+                response = get_openai_client().chat.completions.create(model='gpt-4o-mini',messages=messages,temperature=0, max_tokens=6000, response_format={"type": "json_object"})
                 result = json.loads(response.choices[0].message.content)
                 return result
 
         except Exception as e:
             self.logger.error(f"Error cleaning article: {e}")
             return None
+
+    async def aclean_article(self, llm, text, max_chunk_tokens=30000, overlap_tokens=200):
+        """Async variant of clean_article; chunk analyses run concurrently on the shared AsyncOpenAI client `llm`."""
+        if not text:
+            self.logger.error("Error in article cleaning: No Text provided.")
+            return None
+
+        try:
+            tokenizer = get_encoder()
+            tokens = tokenizer.encode(text)
+
+            if len(tokens) > max_chunk_tokens:
+                chunk_calls = [
+                    llm.chat.completions.create(model='gpt-4o-mini', messages=self._messages(CHUNK_ANALYSIS_PROMPT, tokenizer.decode(chunk_tokens)), temperature=0, max_tokens=4000)
+                    for chunk_tokens in self._split_tokens(tokens, max_chunk_tokens, overlap_tokens)
+                ]
+                analyses = [response.choices[0].message.content for response in await asyncio.gather(*chunk_calls)]
+                messages = self._messages(CHUNK_SYNTHESIS_PROMPT, self._join_chunk_analyses(analyses))
+                response = await llm.chat.completions.create(model='gpt-4o-mini', messages=messages, temperature=0, max_tokens=8000, response_format={"type": "json_object"})
+            else:
+                messages = self._messages(ARTICLE_REPORT_PROMPT, text)
+                response = await llm.chat.completions.create(model='gpt-4o-mini', messages=messages, temperature=0, max_tokens=6000, response_format={"type": "json_object"})
+            return json.loads(response.choices[0].message.content)
+
+        except Exception as e:
+            self.logger.error(f"Error cleaning article: {e}")
+            return None
    
     def parse_llm_response(self, response):
         """Parse the JSON response from the LLM."""
@@ -335,29 +778,12 @@ class BaseScraper(ABC):
             self.logger.error(f"Error parsing LLM response: {e}")
             return None
 
-    def process_articles(self, articles_index_df, date_from, overwrite=False, max_articles = 50):
-        """Process articles and download PDFs, summarize them, and update records."""
-        
-        self.logger.info("Starting process_articles function.")
-        
-        # Start the browser session
-        self.start_browser()  
-        self.logger.info("Browser started and base URL loaded.")
-        
-        try:
-            # Fetch the articles
-            articles = self.fetch_articles()
-
-            self.logger.info(f"Fetched {len(list(articles))} articles from the website.")
-
-        except Exception as e:
-            self.logger.error(f"Error fetching articles: {e}")
-            self.close_browser()
-            return []
-
-        new_articles = []
-
+    def _discover_articles(self, articles, articles_index_df, date_from, overwrite, max_articles):
+        """Yield the articles that are recent enough and not processed yet."""
         for idx, article in enumerate(articles):
+            if self.deadline.expired():
+                self.logger.warning("Deadline exceeded, no more articles are queued")
+                break
             if idx >= max_articles:
                 self.logger.info(f'Reached maximum number of articles {max_articles}')
                 break
@@ -372,7 +798,6 @@ class BaseScraper(ABC):
 
                 # Check article date
                 if article_info['Date'] < date_from:
-                    # self.logger.info(f"Article '{article_info['Title']}' {article_info['Date']} is older than the date_from {date_from}, skipping.")
                     continue
 
                 # Check for existing records
@@ -385,26 +810,320 @@ class BaseScraper(ABC):
                     self.logger.info(f"Article '{article_info['Title']}' - {article_info['Date']} already exists, skipping.")
                     continue
 
-                # Download the PDF
-                downloaded = self.download_pdf(article_info)
-                if not downloaded:
-                    self.logger.error(f"Failed to download PDF for article '{article_info['Title']}'. Skipping article.")
+                entry = self.journal.get(article_key(article_info))
+                if overwrite and entry is not None:
+                    # Re-evaluated from scratch, including articles classified as not macro
+                    self.journal.reset(article_info)
+                    entry = None
+                if entry is None:
+                    self.journal.record(article_info, 'listed')
+                elif entry['is_macro'] is False:
+                    self.logger.info(f"Article '{article_info['Title']}' was already classified as not macro, skipping.")
                     continue
-
-                # Process and summarize the content
-                clean_content = self.get_content_and_summary( article_info )
-                if clean_content:
-                    self.logger.info(f"Content processed for article '{article_info['Title']}' - {article_info['Date']}")
-                    article_info.update(clean_content)
-                    new_articles.append(article_info)
+                else:
+                    self.logger.info(f"Resuming article '{article_info['Title']}' after stage '{entry['stage']}'")
 
             except Exception as e:
-                self.logger.error(f"Error processing article '{article_info['Title']}': {e}")
+                self.logger.error(f"Error processing article {idx}: {e}")
                 continue
 
-        # Close the browser session
+            yield {'info': article_info, 'journal': entry}
+
+    def _record_stage(self, work, stage, **outputs):
+        """Journal a completed stage, unless an earlier run already got past it."""
+        if not reached(work['journal'], stage):
+            self.journal.record(work['info'], stage, **outputs)
+
+    async def _arecord_stage(self, work, stage, **outputs):
+        """Async variant of _record_stage: the SQLite write (and S3 mirror) runs off the event loop."""
+        await asyncio.to_thread(self._record_stage, work, stage, **outputs)
+
+    def _needs_download(self, work):
+        # The PDF is needed to store the article even when every other stage is journaled
+        return not os.path.exists(self.download_path(work['info']['file_name']))
+
+    def _journaled_content(self, work):
+        return work['journal']['content'] if reached(work['journal'], 'parsed') else None
+
+    def _journaled_verdict(self, work):
+        return work['journal']['is_macro'] if reached(work['journal'], 'classified') else None
+
+    def _journaled_summary(self, work):
+        if reached(work['journal'], 'summarized'):
+            info = work['journal']['info']
+            return {'summary': info.get('summary'), 'cleaned_text': info.get('cleaned_text')}
+        return None
+
+    # Once the deadline has expired the stages drop the articles still in flight,
+    # except those already with the LLM whose result is kept.
+    def _download_stage(self, works):
+        """Batched stage: the articles needing their file are downloaded together (see download_pdfs)."""
+        to_download = {}
+        for work in works:
+            if self.deadline.expired():
+                return
+            if self._needs_download(work) and self._journaled_content(work) is None:
+                # HTML articles are read straight from the page, their PDF is printed by the archive stage
+                work['content'] = self.extract_article_text(work['info'])
+                if not work['content']:
+                    to_download[id(work['info'])] = work
+                    continue
+            self._record_stage(work, 'downloaded')
+            yield work
+
+        if self.deadline.expired() or not to_download:
+            return
+        # download_pdfs never holds the WebDriver lock across a yield: the next stage's
+        # queue may be full while the archive stage waits for the WebDriver
+        for article_info, downloaded in self.download_pdfs([work['info'] for work in to_download.values()]):
+            work = to_download[id(article_info)]
+            if not downloaded:
+                self.logger.error(f"Failed to download PDF for article '{article_info['Title']}'. Skipping article.")
+                continue
+            self._record_stage(work, 'downloaded')
+            yield work
+
+    def _parse_stage(self, work):
+        work['content'] = work.get('content') or self._journaled_content(work) or self.read_pdf_content(work['info'])
+        if not work['content']:
+            return None
+        self._record_stage(work, 'parsed', content=work['content'])
+        return work
+
+    def _classify_stage(self, work):
+        if self.deadline.expired():
+            return None
+        is_macro = self._journaled_verdict(work)
+        if is_macro is None:
+            is_macro = self.isMacro(work['content'])
+            self._record_stage(work, 'classified', is_macro=is_macro)
+        if not is_macro:
+            self.logger.warning(f"{work['info']['file_name']} is not consider Macro document, pass")
+            return None
+        return work
+
+    def _summarize_stage(self, work):
+        if self.deadline.expired():
+            return None
+        article_info = work['info']
+        clean_content = self._journaled_summary(work) or self.clean_article(work['content'])
+        if not clean_content:
+            self.logger.error(f"Error cleaning article: {article_info['file_name']}")
+            return None
+        self.logger.info(f"Content processed for article '{article_info['Title']}' - {article_info['Date']}")
+        article_info.update(clean_content)
+        self._record_stage(work, 'summarized')
+        return work
+
+    def _archive_stage(self, work):
+        # Only macro articles get here: the PDF that store_articles uploads is rendered now
+        article_info = work['info']
+        if self._needs_download(work):
+            with self._driver_lock:
+                archived = self.download_pdf(article_info)
+            if not archived:
+                self.logger.error(f"Failed to archive PDF for article '{article_info['Title']}'. Skipping article.")
+                return None
+        return work
+
+    def process_articles(self, articles_index_df, date_from, overwrite=False, max_articles = 50):
+        """Process articles and download PDFs, summarize them, and update records.
+
+        Articles stream through the download -> parse -> classify -> summarize -> archive
+        stages, which are connected by bounded queues and run concurrently (see
+        STAGE_WORKERS), so the next article downloads while the previous one is with the
+        LLM. HTML articles skip the PDF until the archive stage, which only sees macro articles.
+        """
+        
+        self.logger.info("Starting process_articles function.")
+        # Build the tokenizer while the listing is fetched, not when the first article reaches the LLM
+        preload_encoder()
+        
+        # The browser is only started if fetch_articles or download_pdf use self.driver
+        self.set_blocking_profile(self.LISTING_BLOCKING_PROFILE or self.BLOCKING_PROFILE)
+        
+        try:
+            # Fetch the articles
+            articles = self.fetch_articles()
+            self.set_blocking_profile(self.BLOCKING_PROFILE)
+
+            self.logger.info(f"Fetched {len(list(articles))} articles from the website.")
+
+        except Exception as e:
+            self.logger.error(f"Error fetching articles: {e}")
+            self.close_browser()
+            return []
+
+        pipeline = Pipeline([
+            Stage('download', self._download_stage, self.STAGE_WORKERS['download'], batch_size=self.TAB_CONCURRENCY),
+            Stage('parse', self._parse_stage, self.STAGE_WORKERS['parse']),
+            Stage('classify', self._classify_stage, self.STAGE_WORKERS['classify']),
+            Stage('summarize', self._summarize_stage, self.STAGE_WORKERS['summarize']),
+            Stage('archive', self._archive_stage, self.STAGE_WORKERS['archive']),
+        ], queue_size=self.QUEUE_SIZE)
+
+        new_articles = []
+        discovered = self._discover_articles(articles, articles_index_df, date_from, overwrite, max_articles)
+        try:
+            for work in pipeline.run(discovered):
+                new_articles.append(work['info'])
+        finally:
+            # Mirrored to S3 even if the run is interrupted; store_articles reopens it
+            self.journal.close()
+
+        if self.deadline.expired():
+            self.logger.warning(f"Deadline exceeded, keeping {len(new_articles)} articles processed so far")
+
+        # Close the browser session, if one was started
         self.close_browser()
-        self.logger.info("Browser closed after processing articles.")
+
+        if new_articles:
+            self.logger.info(f"{len(new_articles)} new articles processed.")
+        else:
+            self.logger.info("No new articles were processed.")
+
+        return new_articles
+
+    async def afetch_articles(self, http):
+        """Async variant of fetch_articles using the shared httpx.AsyncClient `http`.
+
+        HTTP-only scrapers override it; by default the blocking fetch_articles runs in a thread.
+        """
+        return await asyncio.to_thread(self.fetch_articles)
+
+    async def afetch_article_html(self, http, article_info):
+        """Async variant of fetch_article_html using the shared httpx.AsyncClient `http`.
+
+        By default the blocking fetch_article_html runs in a thread, one article at a
+        time in case it uses the WebDriver.
+        """
+        async with self._browser_lock:
+            return await asyncio.to_thread(self.fetch_article_html, article_info)
+
+    async def afetch_html(self, http, url):
+        """Async variant of fetch_html."""
+        response = await http.get(url)
+        if response.status_code != 200:
+            self.logger.warning(f"Failed to fetch {url}: status code {response.status_code}")
+            return None
+        return response.text
+
+    async def aextract_article_text(self, http, article_info):
+        """Async variant of extract_article_text."""
+        try:
+            html = await self.afetch_article_html(http, article_info)
+        except Exception as e:
+            self.logger.warning(f"Unable to fetch the page of '{article_info['Title']}': {e}")
+            return None
+        if not html:
+            return None
+        text = await asyncio.to_thread(extract_main_text, html)
+        if not text:
+            self.logger.info(f"No article text found in the page of '{article_info['Title']}', printing it instead")
+        return text
+
+    async def adownload_pdf(self, http, article_info):
+        """Async variant of download_pdf using the shared httpx.AsyncClient `http`.
+
+        By default the blocking download_pdf runs in a thread, one article at a time
+        since they share the WebDriver, which it leases on first use.
+        """
+        async with self._browser_lock:
+            return await asyncio.to_thread(self.download_pdf, article_info)
+
+    async def afetch_to_file(self, http, url, file_name):
+        """Async variant of fetch_to_file."""
+        try:
+            download = await astream_pdf(http, url, self.download_path(file_name), self.MAX_PDF_BYTES)
+        except DownloadRejected as e:
+            self.logger.warning(str(e))
+            return False
+        self.logger.debug(f"Downloaded {url} ({download.size} bytes, sha256 {download.sha256}{', cached' if download.from_cache else ''})")
+        return True
+
+    async def _aprocess_article(self, http, llm, work, semaphore):
+        article_info = work['info']
+        async with semaphore:
+            try:
+                content = self._journaled_content(work)
+                if self._needs_download(work) and content is None:
+                    content = await self.aextract_article_text(http, article_info)
+                    if not content:
+                        downloaded = await self.adownload_pdf(http, article_info)
+                        if not downloaded:
+                            self.logger.error(f"Failed to download PDF for article '{article_info['Title']}'. Skipping article.")
+                            return None
+                await self._arecord_stage(work, 'downloaded')
+
+                # PDF parsing is CPU bound, keep it off the event loop
+                content = content or await asyncio.to_thread(self.read_pdf_content, article_info)
+                if not content:
+                    return None
+                await self._arecord_stage(work, 'parsed', content=content)
+
+                is_macro = self._journaled_verdict(work)
+                if is_macro is None:
+                    is_macro = await self.aisMacro(llm, content)
+                    await self._arecord_stage(work, 'classified', is_macro=is_macro)
+                if not is_macro:
+                    self.logger.warning(f"{article_info['file_name']} is not consider Macro document, pass")
+                    return None
+
+                clean_content = self._journaled_summary(work) or await self.aclean_article(llm, content)
+                if not clean_content:
+                    self.logger.error(f"Error cleaning article: {article_info['file_name']}")
+                    return None
+
+                self.logger.info(f"Content processed for article '{article_info['Title']}' - {article_info['Date']}")
+                article_info.update(clean_content)
+                await self._arecord_stage(work, 'summarized')
+
+                if self._needs_download(work) and not await self.adownload_pdf(http, article_info):
+                    self.logger.error(f"Failed to archive PDF for article '{article_info['Title']}'. Skipping article.")
+                    return None
+                return article_info
+
+            except Exception as e:
+                self.logger.error(f"Error processing article '{article_info['Title']}': {e}")
+                return None
+
+    async def aprocess_articles(self, http, llm, articles_index_df, date_from, overwrite=False, max_articles=50):
+        """Async variant of process_articles.
+
+        Listing, downloads and LLM calls of all new articles run concurrently on the
+        shared httpx.AsyncClient `http` and AsyncOpenAI client `llm`.
+        """
+        self.logger.info("Starting aprocess_articles function.")
+        self._browser_lock = asyncio.Lock()
+        preload_encoder()
+
+        try:
+            try:
+                articles = await asyncio.wait_for(self.afetch_articles(http), self.deadline.remaining())
+                self.logger.info(f"Fetched {len(list(articles))} articles from the website.")
+            except Exception as e:
+                self.logger.error(f"Error fetching articles: {e}")
+                return []
+
+            # Discovery reads and writes the journal: keep it off the event loop
+            discovered = await asyncio.to_thread(
+                lambda: list(self._discover_articles(articles, articles_index_df, date_from, overwrite, max_articles)))
+            semaphore = asyncio.Semaphore(self.ASYNC_CONCURRENCY)
+            tasks = [asyncio.ensure_future(self._aprocess_article(http, llm, work, semaphore)) for work in discovered]
+            done = set()
+            if tasks:
+                done, pending = await asyncio.wait(tasks, timeout=self.deadline.remaining())
+                if pending:
+                    # Keep the articles finished in time, cancel the rest
+                    self.logger.warning(f"Deadline exceeded, cancelling {len(pending)} articles and keeping {len(done)}")
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+            new_articles = [article_info for article_info in (task.result() for task in tasks if task in done) if article_info]
+        finally:
+            await asyncio.to_thread(self.journal.close)
+            # Only scrapers that fell back to the browser have one to close
+            await asyncio.to_thread(self.close_browser)
 
         if new_articles:
             self.logger.info(f"{len(new_articles)} new articles processed.")
@@ -415,10 +1134,16 @@ class BaseScraper(ABC):
 
     def store_articles(self, articles):
         for article in articles:
-            self.s3.store_pdf(article['Date'], article['file_name'])
+            self.s3.store_pdf(article['Date'], article['file_name'], local_dir=self.download_dir)
             self.s3.store_json(article)
 
         if articles:
-            self.s3.append_articles_to_index(articles)
+            try:
+                if self.s3.append_articles_to_index(articles):
+                    for article in articles:
+                        self.journal.record(article, 'stored')
+            finally:
+                # Uploads the journal with the stored articles, and closes it again
+                self.journal.close()
         else:
             self.logger.info("No new articles to append.")
@@ -1,9 +1,9 @@
 from .base_scraper import BaseScraper
 from .utils import setup_logging, logging
 from .macro_handler import S3MacroManager
+from .async_runner import run_scraper
 from datetime import datetime
-import requests
-import pandas as pd
+import asyncio
 import argparse
 import os
 from urllib.parse import unquote, urljoin
@@ -12,6 +12,7 @@ from urllib.parse import unquote, urljoin
 logger = setup_logging('BISScraper', level=logging.INFO)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'BIS'
     API_ENDPOINTS = [
         "https://www.bis.org/api/tables/homepage_speeches_cbspeeches.json",
         "https://www.bis.org/api/tables/homepage_speeches_bisspeeches.json",
@@ -28,7 +29,16 @@ class MyScraper(BaseScraper):
         articles = []
         for url in self.API_ENDPOINTS:
             logger.info(f"Fetching data from {url}")
-            response = requests.get(url)
+            response = self.http.get(url, timeout=self.HTTP_TIMEOUT)
+            response.raise_for_status()
+            articles.extend(response.json())
+        return articles
+
+    async def afetch_articles(self, http):
+        logger.info(f"Fetching data from {len(self.API_ENDPOINTS)} endpoints")
+        responses = await asyncio.gather(*(http.get(url) for url in self.API_ENDPOINTS))
+        articles = []
+        for response in responses:
             response.raise_for_status()
             articles.extend(response.json())
         return articles
@@ -39,7 +49,7 @@ class MyScraper(BaseScraper):
         article_link = urljoin(self.BASE_URL, unquote(item['link']))
         
         article_info = {
-            'Organization': 'BIS',
+            'Organization': self.ORGANIZATION,
             'Date': article_date,
             'Title': article_title,
             'Link': article_link,
@@ -51,8 +61,13 @@ class MyScraper(BaseScraper):
 
     def download_pdf(self, article_info):
         pass
+
+    async def adownload_pdf(self, http, article_info):
+        # Same as download_pdf: BIS speeches are not downloaded yet
+        return self.download_pdf(article_info)
     
 def main(date_from, headless=False, overwrite=False):
+    import pandas as pd
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
     except ValueError:
@@ -66,6 +81,13 @@ def main(date_from, headless=False, overwrite=False):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
+
+
+async def amain(date_from, http, llm, overwrite=False):
+    """Async entry point used by run_scrapers --async-http."""
+    return await run_scraper(lambda date_from: MyScraper(date_from, headless=True), date_from, http, llm, overwrite)
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Scrape BIS articles')
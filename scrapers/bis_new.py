@@ -3,22 +3,18 @@ from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
 
 from datetime import datetime
-import time
 from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
 
-import pandas as pd
-import base64
-import requests, os
+import os
 
 logger = setup_logging('BIS', level=logging.INFO)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'BIS'
+    # The listing is only parsed, never printed
+    LISTING_BLOCKING_PROFILE = 'text'
     ARTICLE_URL = "https://www.bis.org/quarterlyreviews/index.htm"
     BASE_URL = 'https://www.bis.org'
 
@@ -27,9 +23,8 @@ class MyScraper(BaseScraper):
         self.date_from = date_from
 
     def fetch_articles(self):
-        self.start_browser()  # Start browser and load cookies
         self.driver.get(self.ARTICLE_URL)
-        time.sleep(2)
+        self.wait_for_document_ready()
         page_source = self.driver.page_source
         soup = BeautifulSoup(page_source, 'html.parser')
         items = soup.find_all("tr", class_=["item even", "item odd"])
@@ -46,7 +41,7 @@ class MyScraper(BaseScraper):
         article_link = urljoin(self.BASE_URL, link['href']) if link else ''
         
         article_info = {
-            'Organization': 'BIS',
+            'Organization': self.ORGANIZATION,
             'Date': article_date,
             'Title': article_title.replace(' ', '_'),
             'Link': article_link,
@@ -57,31 +52,28 @@ class MyScraper(BaseScraper):
 
     def download_pdf(self, article_info):
         pdf_link = article_info['Link'].replace('.htm', '.pdf')
-        pdf_response = requests.get(pdf_link)
-        if pdf_response.status_code == 200:
-            pdf_path = os.path.join('tmp', article_info['file_name'])
-            with open(pdf_path, 'wb') as f:
-                f.write(pdf_response.content)
-            return True
-        else:
-            # Try to find the PDF link from the article page
-            self.driver.get(article_info['Link'])
-            time.sleep(2)
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            pdf_link_tag = soup.find('a', text='Download the PDF version')
-            if pdf_link_tag:
-                pdf_link = urljoin(self.BASE_URL, pdf_link_tag['href'])
-                pdf_response = requests.get(pdf_link)
-                if pdf_response.status_code == 200:
-                    pdf_path = os.path.join('tmp', article_info['file_name'])
-                    with open(pdf_path, 'wb') as f:
-                        f.write(pdf_response.content)
-                    return True
+        try:
+            if self.fetch_to_file(pdf_link, article_info['file_name']):
+                return True
+        except Exception as e:
+            # A network error on the guessed URL still leaves the article page to try
+            self.logger.warning(f"Unable to download {pdf_link}: {e}")
+
+        # Try to find the PDF link from the article page
+        self.driver.get(article_info['Link'])
+        self.wait_for_document_ready()
+        page_source = self.driver.page_source
+        soup = BeautifulSoup(page_source, 'html.parser')
+        pdf_link_tag = soup.find('a', text='Download the PDF version')
+        if pdf_link_tag:
+            pdf_link = urljoin(self.BASE_URL, pdf_link_tag['href'])
+            if self.fetch_to_file(pdf_link, article_info['file_name']):
+                return True
         self.logger.warning(f"Failed to download PDF for {article_info['Title']}")
         return False
 
 def main(date_from, headless=False, overwrite=False):
+    import pandas as pd
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
     except ValueError:
@@ -95,6 +87,7 @@ def main(date_from, headless=False, overwrite=False):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Scrape articles from BIS')
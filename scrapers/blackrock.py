@@ -3,19 +3,16 @@ from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
 
 from datetime import datetime
-import time
 from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
-import pandas as pd
 
 logger = setup_logging('BlackRock', level=logging.INFO)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'BlackRock'
+    # Cookie consent is kept across runs
+    PERSIST_SESSION = True
     ARTICLE_URL = "https://www.blackrock.com/corporate/insights/blackrock-investment-institute/archives#weekly-commentary"
 
     def __init__(self, headless=False):
@@ -23,28 +20,25 @@ class MyScraper(BaseScraper):
 
       
     def fetch_articles(self):
+        from selenium.webdriver.common.by import By
         self.driver.get(self.ARTICLE_URL)
 
         try:
             # Accept cookies if they appear
             try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, '//button[contains(text(), "Accept all")]'))
-                ).click()
+                if not self.has_consent():
+                    self.wait_for_element(By.XPATH, '//button[contains(text(), "Accept all")]', timeout=10, condition='clickable').click()
 
-                WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, '//button[contains(text(), "Accept")]'))
-                ).click()
+                    self.wait_for_element(By.XPATH, '//button[contains(text(), "Accept")]', timeout=10, condition='clickable').click()
 
-                # Save the cookies after accepting terms and conditions
-                self.save_cookies()
+                    # Save the cookies after accepting terms and conditions
+                    self.record_consent()
             except Exception as e:
                 logger.info("Cookies already accepted or no prompt found.")
 
             # Load more articles
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, '//a[contains(@class, "load-more")]'))
-            ).click()
+            self.wait_for_element(By.XPATH, '//a[contains(@class, "load-more")]', timeout=10, condition='clickable').click()
+            self.wait_for_network_idle()
 
             page_source = self.driver.page_source
             soup = BeautifulSoup(page_source, 'html.parser')
@@ -61,7 +55,7 @@ class MyScraper(BaseScraper):
             title = article.find('h2', class_='title').get_text(strip=True)
             pdf_link = urljoin(self.base_url, article.find('a')['href']) if article.find('a') else ''
             article_info = {
-                'Organization': 'BlackRock',
+                'Organization': self.ORGANIZATION,
                 'Date': article_date,
                 'Title': title.replace(' ', '_'),
                 'Link': pdf_link,
@@ -75,13 +69,14 @@ class MyScraper(BaseScraper):
 
     def download_pdf(self, article_info):
         """Implement the unique download logic for BlackRock."""
-        self.start_browser()  # Start browser from BaseScraper
         pdf_link = article_info.get('Link')
         if pdf_link:
             try:
-                self.driver.get(pdf_link)
-                time.sleep(2)
-                self.rename_downloaded_file(article_info['file_name'])
+                with self.track_download() as download:
+                    self.driver.get(pdf_link)
+                    if not self.wait_for_download(download):
+                        return None
+                    download.save_as(self.download_path(article_info['file_name']))
                 return True
             except Exception as e:
                 self.logger.error(f"Failed to download PDF for {article_info['Title']}: {e}")
@@ -90,6 +85,7 @@ class MyScraper(BaseScraper):
         return None
     
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -104,6 +100,7 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,165 @@
+import atexit
+import logging
+import threading
+from urllib.parse import urlsplit
+from .utils import setup_logging
+
+logger = setup_logging('BrowserPool', level=logging.INFO)
+
+
+class BrowserPool:
+    """Warm Chrome instances shared by the scrapers of a run.
+
+    A scraper leases a browser for as long as it needs one and hands it back
+    afterwards, instead of launching (and stealth-patching) a fresh Chrome every
+    time. Between two leases the browser is reset: extra tabs closed, cookies, cache,
+    site storage (localStorage, IndexedDB, ...) and blocked URLs cleared, and the
+    download directory pointed at the next scraper's.
+    At most `max_browsers` browsers exist at a time (no limit if None); further
+    leases wait for one to be returned.
+    """
+
+    def __init__(self, max_browsers=None):
+        self.max_browsers = max_browsers
+        self.launched = 0
+        self._idle = []
+        self._leased = set()
+        self._launching = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, download_dir, launch, deadline=None):
+        """Lease a browser downloading into `download_dir`.
+
+        `launch` creates a new WebDriver when no idle one is available. Waiting for a
+        free browser stops with ScraperTimeout when `deadline` expires.
+        """
+        driver = None
+        with self._cond:
+            while True:
+                if deadline is not None:
+                    deadline.check()
+                if self._idle:
+                    driver = self._idle.pop()
+                    break
+                if self.max_browsers is None or len(self._leased) + self._launching < self.max_browsers:
+                    self._launching += 1
+                    break
+                self._cond.wait(None if deadline is None else deadline.remaining())
+
+            if driver is not None:
+                self._leased.add(driver)
+
+        if driver is None:
+            try:
+                driver = launch()
+            finally:
+                with self._cond:
+                    self._launching -= 1
+                    if driver is not None:
+                        self._leased.add(driver)
+                        self.launched += 1
+                    self._cond.notify()
+            logger.info(f"Launched browser {self.launched}")
+
+        try:
+            # Downloads of this lease go to the scraper's own directory
+            driver.execute_cdp_cmd('Browser.setDownloadBehavior', {'behavior': 'allow', 'downloadPath': download_dir})
+        except Exception:
+            self.discard(driver)
+            raise
+        return driver
+
+    def release(self, driver):
+        """Give a leased browser back, reset for the next lease."""
+        try:
+            self._reset(driver)
+        except Exception as e:
+            logger.warning(f"Unable to reset browser, discarding it: {e}")
+            self.discard(driver)
+            return
+        with self._cond:
+            self._leased.discard(driver)
+            self._idle.append(driver)
+            self._cond.notify()
+
+    def discard(self, driver):
+        """Quit a browser and drop it from the pool, e.g. after a crash or a cancelled scraper."""
+        with self._cond:
+            self._leased.discard(driver)
+            self._cond.notify()
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting browser: {e}")
+
+    def _reset(self, driver):
+        origins = self._visited_origins(driver)
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.get('about:blank')
+        # Consent and other site state also live in localStorage, IndexedDB, service workers, ...
+        for origin in origins:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+
+    def _visited_origins(self, driver):
+        """Origins the lease may have stored data for: pages in the tabs' history, and cookie domains."""
+        origins = set()
+        for handle in driver.window_handles:
+            driver.switch_to.window(handle)
+            for entry in driver.execute_cdp_cmd('Page.getNavigationHistory', {})['entries']:
+                url = urlsplit(entry['url'])
+                if url.scheme in ('http', 'https'):
+                    origins.add(f"{url.scheme}://{url.netloc}")
+        for cookie in driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']:
+            domain = cookie['domain'].lstrip('.')
+            origins.update((f"https://{domain}", f"https://www.{domain}"))
+        return origins
+
+    def close(self):
+        """Quit every browser of the pool."""
+        with self._cond:
+            drivers = self._idle + list(self._leased)
+            self._idle, self._leased = [], set()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Error quitting browser: {e}")
+        if drivers:
+            logger.info(f"Closed {len(drivers)} browsers ({self.launched} launched in total)")
+
+
+# Headless and headed browsers are launched with different options, so they get separate pools
+_pools = {}
+_pools_lock = threading.Lock()
+_max_browsers = None
+
+
+def configure_browser_pool(max_browsers):
+    """Limit the number of browsers of the pools created from now on."""
+    global _max_browsers
+    _max_browsers = max_browsers
+
+
+def get_browser_pool(headless):
+    """Process-wide browser pool for headless or headed browsers."""
+    with _pools_lock:
+        if headless not in _pools:
+            _pools[headless] = BrowserPool(_max_browsers)
+        return _pools[headless]
+
+
+@atexit.register
+def close_browser_pools():
+    """Quit all pooled browsers, at the end of a run."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,109 @@
+import contextvars
+import logging
+import threading
+import time
+from .utils import setup_logging
+
+logger = setup_logging('Deadline', level=logging.INFO)
+
+
+class ScraperTimeout(Exception):
+    """Raised when a scraper keeps working past its deadline."""
+
+
+class Deadline:
+    """Point in time after which a scraper must stop.
+
+    A deadline is bounded by its own budget of `seconds` and by its `parent` (the run
+    deadline), whichever comes first. Without either it never expires. Once started,
+    a watchdog timer expires it on time and runs the registered cancel callbacks, which
+    is how blocking calls (a hung page load, a long sleep) get interrupted.
+    """
+
+    def __init__(self, seconds=None, parent=None):
+        limits = []
+        if seconds:
+            limits.append(time.monotonic() + seconds)
+        if parent is not None and parent.expires_at is not None:
+            limits.append(parent.expires_at)
+        self.expires_at = min(limits) if limits else None
+        self._expired = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def remaining(self):
+        """Seconds left, or None for a deadline that never expires."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return self._expired.is_set() or (self.expires_at is not None and time.monotonic() >= self.expires_at)
+
+    def check(self):
+        """Raise ScraperTimeout if the deadline has passed."""
+        if self.expired():
+            raise ScraperTimeout("Deadline exceeded")
+
+    def sleep(self, seconds):
+        """Sleep like time.sleep, but wake up and raise ScraperTimeout as soon as the deadline expires."""
+        remaining = self.remaining()
+        if remaining is not None:
+            seconds = min(seconds, remaining)
+        self._expired.wait(seconds)
+        self.check()
+
+    def on_expire(self, callback):
+        """Register a callback run by the watchdog when the deadline expires."""
+        with self._lock:
+            if not self._expired.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def start(self):
+        """Start the watchdog timer."""
+        remaining = self.remaining()
+        if remaining is not None and self._timer is None:
+            self._timer = threading.Timer(remaining, self.expire)
+            self._timer.daemon = True
+            self._timer.start()
+        return self
+
+    def stop(self):
+        """Stop the watchdog timer without expiring the deadline."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def expire(self):
+        """Expire the deadline now and run the cancel callbacks."""
+        with self._lock:
+            if self._expired.is_set():
+                return
+            self._expired.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Cancel callback failed: {e}")
+
+
+# Deadline of the scraper running in the current thread or asyncio task
+_current = contextvars.ContextVar('deadline', default=None)
+
+
+def current_deadline():
+    """Deadline set for the scraper running in this thread or task, or None."""
+    return _current.get()
+
+
+def set_current_deadline(deadline):
+    """Set the deadline of this thread or task. Returns a token for reset_current_deadline."""
+    return _current.set(deadline)
+
+
+def reset_current_deadline(token):
+    _current.reset(token)
@@ -0,0 +1,63 @@
+import os
+import shutil
+import tempfile
+
+# Suffixes of the files Chrome writes while a download is in progress
+PARTIAL_SUFFIXES = ('.crdownload', '.tmp')
+
+
+class DownloadTracker:
+    """One browser download, isolated in its own directory.
+
+    The browser's downloads are pointed at a fresh directory for the duration of the
+    tracker, so the only file that can appear there is the one being tracked: no
+    guessing by modification time, and concurrent downloads of other scrapers or
+    tabs can never be picked up by mistake.
+
+    Used as a context manager through BaseScraper.track_download().
+    """
+
+    def __init__(self, driver, download_dir):
+        self.driver = driver
+        self.download_dir = download_dir
+        self.directory = tempfile.mkdtemp(prefix='.download-', dir=download_dir)
+        self.path = None
+        self._sizes = {}
+
+    def __enter__(self):
+        self._set_download_path(self.directory)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            self._set_download_path(self.download_dir)
+        finally:
+            shutil.rmtree(self.directory, ignore_errors=True)
+        return False
+
+    def _set_download_path(self, path):
+        self.driver.execute_cdp_cmd('Browser.setDownloadBehavior', {'behavior': 'allow', 'downloadPath': path})
+
+    def finished_file(self):
+        """Path of the downloaded file once Chrome has finished writing it, else None.
+
+        Complete means: no partial file left and the same non-zero size on two
+        consecutive checks.
+        """
+        names = os.listdir(self.directory)
+        if len(names) != 1 or names[0].endswith(PARTIAL_SUFFIXES):
+            return None
+        path = os.path.join(self.directory, names[0])
+        size = os.path.getsize(path)
+        if size > 0 and self._sizes.get(path) == size:
+            self.path = path
+        self._sizes[path] = size
+        return self.path
+
+    def save_as(self, target_path):
+        """Move the finished download to `target_path` and return it."""
+        if self.path is None:
+            raise FileNotFoundError(f"No finished download in {self.directory}")
+        os.replace(self.path, target_path)
+        self.path = target_path
+        return target_path
@@ -3,22 +3,18 @@ from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
 
 from datetime import datetime
-import time
 from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
 
-import pandas as pd
-import base64
-import requests, os
+import os
 
 logger = setup_logging('ECB', level=logging.INFO)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'ECB'
+    # The listing is only parsed, never printed
+    LISTING_BLOCKING_PROFILE = 'text'
     ARTICLE_URL = "https://www.ecb.europa.eu/press/pr/activities/mopo/html/index.en.html"
 
     def __init__(self, date_from, headless=True):
@@ -40,7 +36,6 @@ class MyScraper(BaseScraper):
 
             return rows
                 
-        self.start_browser()  # Start browser and load cookies
         self.driver.get(self.ARTICLE_URL)
 
         page_source = self.driver.execute_script("return document.documentElement.outerHTML;")
@@ -75,7 +70,7 @@ class MyScraper(BaseScraper):
         article_link = urljoin('https://www.ecb.europa.eu/', link['href'])
         article_title = link.text.strip()
         article_info = {
-            'Organization': 'ECB',
+            'Organization': self.ORGANIZATION,
             'Date': article_date,
             'Title': article_title.replace(' ', '_'),
             'Link': article_link,
@@ -85,34 +80,26 @@ class MyScraper(BaseScraper):
         return article_info
 
 
+    def fetch_article_html(self, article_info):
+        if article_info['Link'].endswith('.html'):
+            return self.fetch_html(article_info['Link'])
+        return None
+
     def download_pdf(self, article_info):
         if article_info['Link'].endswith('.html'):
             self.driver.get(article_info['Link'])
-            time.sleep(2)  # wait till loading finish
-            result = self.driver.execute_cdp_cmd("Page.printToPDF", {
-                "landscape": False,
-                "displayHeaderFooter": False,
-                "printBackground": True,
-                "preferCSSPageSize": True,
-            })
-            pdf_base64 = result['data']
-            with open('tmp/data.pdf', 'wb') as f:
-                f.write(base64.b64decode(pdf_base64))
-
-            self.rename_downloaded_file(article_info['file_name'])
+            self.wait_for_network_idle()  # wait till loading finish
+            self.capture_pdf(article_info['file_name'])
+
             return True
         elif '.pdf' in article_info['Link']:
-            pdf_response = requests.get(article_info['Link'])
-            if pdf_response.status_code == 200:
-                pdf_path = os.path.join('tmp', article_info['file_name'])
-                with open(pdf_path, 'wb') as f:
-                    f.write(pdf_response.content)
-                return True
+            return self.fetch_to_file(article_info['Link'], article_info['file_name'])
         else:
             self.logger.warning(f"No PDF link found for {article_info['Title']}")
         return None
 
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -127,6 +114,7 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
 
 
 if __name__ == '__main__':
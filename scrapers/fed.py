@@ -1,36 +1,34 @@
 from .base_scraper import BaseScraper
 from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
+from .async_runner import run_scraper
 
 from datetime import datetime
-import time
-from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
 
-import pandas as pd
-import base64
-import requests, os, re
+import re
 
 logger = setup_logging('FED', level=logging.INFO)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'FED'
     ARTICLE_URL = "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm"
     
     def __init__(self, headless=True):
         super().__init__('FED', self.ARTICLE_URL, headless=headless)
 
     def fetch_articles(self):
-        self.start_browser()  # Start browser and load cookies
-        # self.driver.get(self.ARTICLE_URL)
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
-        response = requests.get(self.ARTICLE_URL, headers=headers)
+        response = self.http.get(self.ARTICLE_URL, timeout=self.HTTP_TIMEOUT)
+        return self._parse_meetings(response.content)
+
+    async def afetch_articles(self, http):
+        response = await http.get(self.ARTICLE_URL)
+        return self._parse_meetings(response.content)
+
+    def _parse_meetings(self, content):
         try:
-            soup = BeautifulSoup(response.content, 'html.parser')          
+            soup = BeautifulSoup(content, 'html.parser')          
             pdf_divs = soup.find_all('a', href=lambda href: href and href.endswith('.pdf'))
             meetings = [] 
             # Iterate through all the PDF links and find the parent div it belongs to
@@ -54,7 +52,7 @@ class MyScraper(BaseScraper):
                 date_str = statementLink[0].split('/')[-1].split('monetary')[1][:8]
                 article_date = datetime.strptime(date_str, "%Y%m%d").strftime("%Y-%m-%d")
                 article_info = {
-                    'Organization': 'FED',
+                    'Organization': self.ORGANIZATION,
                     'Date': article_date,
                     'Title': 'Federal Reserve Press Release',
                     'Link': f"https://www.federalreserve.gov{statementLink[0]}",
@@ -70,7 +68,7 @@ class MyScraper(BaseScraper):
                 meeting_date_str = minutesLink[0].split('/')[-1].split('fomcminutes')[1][:8]
                 meeting_date = datetime.strptime(meeting_date_str, "%Y%m%d").strftime("%Y-%m-%d")
                 article_info = {
-                    'Organization': 'FED',
+                    'Organization': self.ORGANIZATION,
                     'Date': article_date,
                     'Title': 'Federal Reserve Minutes',
                     'Link': f"https://www.federalreserve.gov{minutesLink[0]}",
@@ -84,36 +82,43 @@ class MyScraper(BaseScraper):
             return {}
 
 
+    def fetch_article_html(self, article_info):
+        if article_info['Link'].endswith('.html'):
+            return self.fetch_html(article_info['Link'])
+        return None
+
     def download_pdf(self, article_info):
         if article_info['Link'].endswith('.html'):
-            self.driver.execute_script("window.open('');")
-            self.driver.switch_to.window(self.driver.window_handles[1])
             self.driver.get(article_info['Link'])
-            time.sleep(2)  # wait till loading finish
-            result = self.driver.execute_cdp_cmd("Page.printToPDF", {
-                "landscape": False,
-                "displayHeaderFooter": False,
-                "printBackground": True,
-                "preferCSSPageSize": True,
-            })
-            pdf_base64 = result['data']
-            with open('tmp/data.pdf', 'wb') as f:
-                f.write(base64.b64decode(pdf_base64))
-
-            self.rename_downloaded_file(article_info['file_name'])
-            return True
+            return self.capture_tab(article_info)
         elif article_info['Link'].endswith('.pdf'):
-            pdf_response = requests.get(article_info['Link'])
-            if pdf_response.status_code == 200:
-                pdf_path = os.path.join('tmp', article_info['file_name'])
-                with open(pdf_path, 'wb') as f:
-                    f.write(pdf_response.content)
-                return True
+            return self.fetch_to_file(article_info['Link'], article_info['file_name'])
         else:
             self.logger.warning(f"No PDF link found for {article_info['Title']}")
         return None
+
+    def tab_url(self, article_info):
+        # PDFs are fetched over HTTP, only the HTML statements are printed
+        return article_info['Link'] if article_info['Link'].endswith('.html') else None
+
+    def capture_tab(self, article_info):
+        self.wait_for_network_idle()  # wait till loading finish
+        self.capture_pdf(article_info['file_name'])
+
+        return True
+
+    async def afetch_article_html(self, http, article_info):
+        if article_info['Link'].endswith('.html'):
+            return await self.afetch_html(http, article_info['Link'])
+        return None
+
+    async def adownload_pdf(self, http, article_info):
+        if article_info['Link'].endswith('.pdf'):
+            return await self.afetch_to_file(http, article_info['Link'], article_info['file_name'])
+        return await super().adownload_pdf(http, article_info)
     
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -128,6 +133,12 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
+
+
+async def amain(date_from, http, llm, overwrite=False):
+    """Async entry point used by run_scrapers --async-http."""
+    return await run_scraper(lambda date_from: MyScraper(headless=True), date_from, http, llm, overwrite)
 
 
 if __name__ == '__main__':
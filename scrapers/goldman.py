@@ -3,52 +3,63 @@ from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
 
 from datetime import datetime
-import time
 from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
 
-import pandas as pd
-import base64
-import requests
 
 logger = setup_logging('Goldman', level=logging.INFO)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'GoldmanSachs'
     ARTICLE_URL = "https://am.gs.com/en-us/institutions/insights/topics/macroeconomics"
-    API_URL = 'https://am.gs.com/services/search-engine/en-us/institutions/search/insights?hitsPerPage=15&tags=product%2Fmacroeconomics'
+    API_URL = 'https://am.gs.com/services/search-engine/en-us/institutions/search/insights'
+    # Insights per page of the search API, and pages read at most per run
+    PAGE_SIZE = 50
+    MAX_PAGES = 20
 
     def __init__(self, date_from, headless=True):
         super().__init__('Goldman', self.ARTICLE_URL, headless=headless)
         self.date_from = date_from
 
     def fetch_articles(self):
-        self.start_browser()  
-
-        self.driver.get(self.ARTICLE_URL)
-        institution_button = WebDriverWait(self.driver, 3).until(
-                EC.element_to_be_clickable((By.ID, "button-select-institutions"))
-            )
-        institution_button.click()
-        response = requests.get(self.API_URL)
-        if response.status_code == 200:
-            data = response.json()
-
-            # remove articles < date_from for faster processing
-            articles = data['insights']['hits']
-            filtered_articles = [article for article in articles if datetime.strptime(article['publishDate'], "%Y-%m-%dT%H:%M:%S.%fZ").strftime("%Y-%m-%d") > self.date_from]
-
-            return filtered_articles
+        """Insights published since date_from, newest first, read page by page from the search API.
+
+        The API lists insights newest first, so paging stops at the first page reaching
+        back past date_from. No browser is needed: the API is public.
+        """
+        articles, seen = [], set()
+        for page in range(self.MAX_PAGES):
+            self.check_deadline()
+            params = {'hitsPerPage': self.PAGE_SIZE, 'page': page, 'tags': 'product/macroeconomics'}
+            response = self.http.get(self.API_URL, params=params, timeout=self.HTTP_TIMEOUT)
+            if response.status_code != 200:
+                self.logger.warning(f"Failed to fetch page {page} of the insights: status code {response.status_code}")
+                break
+            insights = response.json()['insights']
+            # Pages may be numbered from 1, in which case page 0 repeats page 1
+            hits = [hit for hit in insights['hits'] if hit['slug'] not in seen]
+            seen.update(hit['slug'] for hit in hits)
+            dates = [self._publish_date(hit) for hit in hits]
+            articles.extend(hit for hit, date in zip(hits, dates) if date >= self.date_from)
+
+            if dates and min(dates) < self.date_from:
+                break
+            # A short page is the last one; a page of repeats past page 1 means the API ignores the page number
+            if len(insights['hits']) < self.PAGE_SIZE or (not hits and page > 1):
+                break
+        self.logger.info(f"Found {len(articles)} insights since {self.date_from} in {page + 1} page(s)")
+        return articles
+
+    @staticmethod
+    def _publish_date(article):
+        return datetime.strptime(article['publishDate'], "%Y-%m-%dT%H:%M:%S.%fZ").strftime("%Y-%m-%d")
 
     def extract_article_info(self, article):
         parsed_datetime = datetime.fromisoformat(article['publishDate'].replace('Z', '+00:00'))
         formatted_date = parsed_datetime.strftime('%Y-%m-%d')
         article_info = {
-                'Organization': 'GoldmanSachs',
+                'Organization': self.ORGANIZATION,
                 'Date': formatted_date,
                 'Title': article['title'].replace(' ', '_'),
                 'Link': 'https://am.gs.com' + article['slug'],
@@ -59,26 +70,24 @@ class MyScraper(BaseScraper):
         return article_info
 
 
-    def download_pdf(self, article_info):
+    def fetch_article_html(self, article_info):
+        return self.fetch_html(article_info['Link'])
 
-        self.driver.execute_script("window.open('');")
-        self.driver.switch_to.window(self.driver.window_handles[1])
+    def download_pdf(self, article_info):
         self.driver.get(article_info['Link'])
-        time.sleep(2)  # wait till loading finish
-        result = self.driver.execute_cdp_cmd("Page.printToPDF", {
-            "landscape": False,
-            "displayHeaderFooter": False,
-            "printBackground": True,
-            "preferCSSPageSize": True,
-        })
-        pdf_base64 = result['data']
-        with open('tmp/data.pdf', 'wb') as f:
-            f.write(base64.b64decode(pdf_base64))
-
-        self.rename_downloaded_file(article_info['file_name'])
+        return self.capture_tab(article_info)
+
+    def tab_url(self, article_info):
+        return article_info['Link']
+
+    def capture_tab(self, article_info):
+        self.wait_for_network_idle()  # wait till loading finish
+        self.capture_pdf(article_info['file_name'])
+
         return True
     
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -93,6 +102,7 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,97 @@
+import re
+
+# Article text shorter than this is most likely a teaser, a paywall or a page rendered
+# by scripts: the article then goes through the printed PDF instead.
+MIN_TEXT_LENGTH = 500
+
+# Elements that never hold article text
+NOISE_TAGS = ['script', 'style', 'noscript', 'template', 'svg', 'canvas', 'iframe', 'form',
+              'button', 'select', 'nav', 'header', 'footer', 'aside']
+# Class or id of page chrome, unless it also looks like content
+UNLIKELY = re.compile(r'cookie|consent|banner|breadcrumb|menu|navbar|sidebar|share|social|'
+                      r'newsletter|subscribe|related|recommend|promo|modal|popup|masthead|footer', re.I)
+LIKELY = re.compile(r'article|body|content|main|story|text|post', re.I)
+BLOCK_TAGS = ['p', 'div', 'section', 'article', 'main', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+              'li', 'ul', 'ol', 'blockquote', 'pre', 'table', 'tr', 'dd', 'dt', 'figcaption']
+PARAGRAPH_TAGS = ['p', 'li', 'blockquote', 'pre', 'td', 'dd']
+
+
+def _hints(tag):
+    return f"{' '.join(tag.get('class') or [])} {tag.get('id') or ''}"
+
+
+def _link_density(tag, text_length):
+    link_length = sum(len(a.get_text(strip=True)) for a in tag.find_all('a'))
+    return link_length / text_length if text_length else 1.0
+
+
+def _best_candidate(body):
+    """Container holding most of the paragraph text, scored the way Readability does."""
+    scores = {}
+    for paragraph in body.find_all(PARAGRAPH_TAGS):
+        text = paragraph.get_text(' ', strip=True)
+        if len(text) < 25:
+            continue
+        score = 1 + text.count(',') + min(len(text) // 100, 3)
+        parent = paragraph.parent
+        grandparent = parent.parent if parent is not None else None
+        for ancestor, share in ((parent, 1.0), (grandparent, 0.5)):
+            if ancestor is not None and ancestor.name not in (None, '[document]'):
+                scores[ancestor] = scores.get(ancestor, 0.0) + score * share
+
+    best, best_score = None, 0.0
+    for candidate, score in scores.items():
+        if candidate.name in ('article', 'main'):
+            score *= 1.25
+        text_length = len(candidate.get_text(' ', strip=True))
+        score *= 1 - _link_density(candidate, text_length)
+        if score > best_score:
+            best, best_score = candidate, score
+    if best is None:
+        return body
+
+    # Articles often split their text over sibling blocks: climb while the parent adds text
+    while best.parent is not None and best.parent.name not in ('body', '[document]'):
+        parent_scores = [scores.get(child, 0.0) for child in best.parent.find_all(recursive=False)]
+        if sum(score > best_score * 0.2 for score in parent_scores) < 2:
+            break
+        best = best.parent
+    return best
+
+
+def _text(tag):
+    for br in tag.find_all('br'):
+        br.replace_with('\n')
+    for block in tag.find_all(BLOCK_TAGS):
+        block.insert_before('\n')
+        block.insert_after('\n')
+    lines = (re.sub(r'\s+', ' ', line).strip() for line in tag.get_text().split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def extract_main_text(html, min_length=MIN_TEXT_LENGTH):
+    """Main text of an HTML page, without navigation, banners and other page chrome.
+
+    A Readability-style extraction: noise is dropped, the container with the densest
+    paragraph text is kept. Returns None when less than `min_length` characters are
+    left, e.g. for a page whose content is rendered by scripts.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    body = soup.body or soup
+    for tag in body.find_all(NOISE_TAGS):
+        tag.decompose()
+    for tag in body.find_all(True):
+        if tag.decomposed or tag.name in ('article', 'main', 'body'):
+            continue
+        hints = _hints(tag)
+        if UNLIKELY.search(hints) and not LIKELY.search(hints):
+            tag.decompose()
+
+    text = _text(_best_candidate(body))
+    title = soup.find('h1')
+    title = title.get_text(' ', strip=True) if title is not None else None
+    if title and title not in text:
+        text = f"{title}\n{text}"
+    return text if len(text) >= min_length else None
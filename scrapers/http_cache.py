@@ -0,0 +1,195 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from .utils import setup_logging
+
+logger = setup_logging('HTTPCache', level=logging.INFO)
+
+# Cached responses live outside tmp/, which is wiped at the start of every run
+CACHE_DIR = os.path.join('state', 'http_cache')
+# Set to 0 to disable the cache, and to bound its size in MB
+CACHE_ENV = 'HTTP_CACHE'
+MAX_SIZE_ENV = 'HTTP_CACHE_MAX_MB'
+DEFAULT_MAX_MB = 512
+
+# httpx request extension for requests whose body is cached by the caller (see pdf_download)
+BYPASS_EXTENSION = 'bypass_http_cache'
+
+# Headers describing the body as sent over the wire: the cache stores the decoded body
+WIRE_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'}
+
+
+def cache_enabled():
+    return os.getenv(CACHE_ENV, '1') != '0'
+
+
+def cacheable(status_code, headers):
+    """True for a complete response that can be revalidated with a conditional request."""
+    if status_code != 200 or 'no-store' in headers.get('Cache-Control', '').lower():
+        return False
+    return bool(headers.get('ETag') or headers.get('Last-Modified'))
+
+
+class HTTPCache:
+    """On-disk cache of GET responses, revalidated with conditional requests.
+
+    Responses with an ETag or a Last-Modified header are kept, body and metadata in
+    two files named after the URL's hash. The next request for the URL carries
+    If-None-Match / If-Modified-Since, and a 304 is answered with the stored body.
+    The cache is bounded to `max_bytes`, least recently used entries going first.
+    """
+
+    def __init__(self, directory=None, max_bytes=None):
+        self.directory = directory or os.path.join(os.getcwd(), CACHE_DIR)
+        self.max_bytes = max_bytes or int(os.getenv(MAX_SIZE_ENV, DEFAULT_MAX_MB)) * 1024 * 1024
+        self._lock = threading.Lock()
+        self._index = None  # key -> (size, last used)
+
+    def _key(self, url):
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _meta_path(self, key):
+        return os.path.join(self.directory, f'{key}.json')
+
+    def body_path(self, key):
+        return os.path.join(self.directory, f'{key}.body')
+
+    def _load_index(self):
+        # Called with the lock held. Loaded once: entries written by other processes
+        # afterwards are added by lookup, which reads their metadata from disk.
+        if self._index is None:
+            self._index = {}
+            os.makedirs(self.directory, exist_ok=True)
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    key = name[:-5]
+                    try:
+                        with open(self._meta_path(key)) as f:
+                            meta = json.load(f)
+                        self._index[key] = (meta['size'], meta['last_used'])
+                    except (OSError, ValueError, KeyError):
+                        self._remove(key)
+        return self._index
+
+    def lookup(self, url):
+        """Metadata of the cached response for `url` ({'key', 'url', 'headers', ...}), or None."""
+        key = self._key(url)
+        with self._lock:
+            index = self._load_index()
+            # Not trusting the index for misses: a worker process may have cached the URL since
+            try:
+                with open(self._meta_path(key)) as f:
+                    meta = json.load(f)
+                index[key] = (meta['size'], meta['last_used'])
+            except FileNotFoundError:
+                # Evicted, possibly by another process
+                if key in index:
+                    self._remove(key)
+                return None
+            except (OSError, ValueError, KeyError):
+                self._remove(key)
+                return None
+        if not os.path.exists(self.body_path(key)):
+            return None
+        return meta
+
+    @staticmethod
+    def conditional_headers(meta):
+        headers = {}
+        if meta['headers'].get('ETag'):
+            headers['If-None-Match'] = meta['headers']['ETag']
+        if meta['headers'].get('Last-Modified'):
+            headers['If-Modified-Since'] = meta['headers']['Last-Modified']
+        return headers
+
+    def read(self, meta):
+        """Body of a cached response, marking it as recently used."""
+        with open(self.body_path(meta['key']), 'rb') as f:
+            body = f.read()
+        self.touch(meta)
+        return body
+
+    def touch(self, meta):
+        meta['last_used'] = time.time()
+        with self._lock:
+            self._write_meta(meta)
+            self._load_index()[meta['key']] = (meta['size'], meta['last_used'])
+
+    def store(self, url, headers, content=None, path=None):
+        """Cache a response body, given as bytes (`content`) or as a file (`path`)."""
+        key = self._key(url)
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if content is not None:
+                    f.write(content)
+                else:
+                    with open(path, 'rb') as src:
+                        shutil.copyfileobj(src, f)
+            size = os.path.getsize(tmp_path)
+            if size > self.max_bytes:
+                os.remove(tmp_path)
+                return
+            os.replace(tmp_path, self.body_path(key))
+        except OSError as e:
+            logger.warning(f"Unable to cache {url}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        meta = {
+            'key': key,
+            'url': url,
+            'headers': {name: value for name, value in headers.items() if name.lower() not in WIRE_HEADERS},
+            'size': size,
+            'last_used': time.time(),
+        }
+        with self._lock:
+            self._write_meta(meta)
+            index = self._load_index()
+            index[key] = (size, meta['last_used'])
+            self._evict(index)
+
+    def _write_meta(self, meta):
+        tmp_path = f"{self._meta_path(meta['key'])}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._meta_path(meta['key']))
+
+    def _evict(self, index):
+        total = sum(size for size, _ in index.values())
+        for key in sorted(index, key=lambda k: index[k][1]):
+            if total <= self.max_bytes:
+                break
+            total -= index[key][0]
+            self._remove(key)
+
+    def _remove(self, key):
+        if self._index is not None:
+            self._index.pop(key, None)
+        for path in (self._meta_path(key), self.body_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache():
+    """Process-wide HTTP cache, or None when disabled with HTTP_CACHE=0."""
+    global _cache
+    if not cache_enabled():
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = HTTPCache()
+    return _cache
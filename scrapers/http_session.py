@@ -0,0 +1,129 @@
+import threading
+from .http_cache import BYPASS_EXTENSION, WIRE_HEADERS, cacheable, get_http_cache
+
+# One user agent for every request of the scrapers, plain HTTP and Chrome alike
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36'
+
+# Seconds to open a connection and to wait for data, for requests without an explicit timeout
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 30
+# Hosts with a pool of open connections, and connections kept (and allowed) per host.
+# Threads wait for a free connection rather than opening more.
+POOL_HOSTS = 32
+CONNECTIONS_PER_HOST = 8
+# Retries of a failed connection or of a 429/5xx response, waiting 0.5s, 1s, 2s, ...
+# (or the server's Retry-After) in between
+RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _adapter():
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class ScraperHTTPAdapter(HTTPAdapter):
+        """Default timeouts, and GET responses revalidated against the HTTP cache."""
+
+        def send(self, request, stream=False, timeout=None, **kwargs):
+            if timeout is None:
+                timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+            cache = get_http_cache()
+            # Streamed bodies are never read into memory here: their reader caches them (see pdf_download)
+            if cache is None or stream or request.method != 'GET':
+                return super().send(request, stream=stream, timeout=timeout, **kwargs)
+
+            cached = cache.lookup(request.url)
+            if cached:
+                for name, value in cache.conditional_headers(cached).items():
+                    request.headers.setdefault(name, value)
+            response = super().send(request, stream=False, timeout=timeout, **kwargs)
+            if response.status_code == 304 and cached:
+                response.status_code = 200
+                response.reason = 'OK (cached)'
+                response.headers.update(cached['headers'])
+                response.headers.pop('Content-Encoding', None)
+                response._content = cache.read(cached)
+                response.from_cache = True
+            elif cacheable(response.status_code, response.headers):
+                cache.store(request.url, response.headers, content=response.content)
+            return response
+
+    retries = Retry(
+        total=RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        # The last response is returned as is, for the caller's status code check
+        raise_on_status=False,
+    )
+    return ScraperHTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=CONNECTIONS_PER_HOST,
+                              pool_block=True, max_retries=retries)
+
+
+def get_http_session():
+    """Process-wide requests.Session with keep-alive pools, retries, default timeouts
+    and the conditional-GET cache of scrapers.http_cache.
+
+    Shared by all scrapers (and threads) of a process, so that every request to a
+    host after the first reuses an open TLS connection.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+
+                session = requests.Session()
+                session.headers['User-Agent'] = USER_AGENT
+                adapter = _adapter()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def async_transport(limits):
+    """httpx transport with the same conditional-GET cache as the requests session."""
+    import asyncio
+    import httpx
+
+    class CachingTransport(httpx.AsyncBaseTransport):
+        def __init__(self):
+            self._transport = httpx.AsyncHTTPTransport(limits=limits)
+
+        async def handle_async_request(self, request):
+            cache = get_http_cache()
+            if cache is None or request.method != 'GET' or request.extensions.get(BYPASS_EXTENSION):
+                return await self._transport.handle_async_request(request)
+
+            url = str(request.url)
+            cached = await asyncio.to_thread(cache.lookup, url)
+            if cached:
+                for name, value in cache.conditional_headers(cached).items():
+                    if name not in request.headers:
+                        request.headers[name] = value
+            response = await self._transport.handle_async_request(request)
+            if response.status_code == 304 and cached:
+                await response.aclose()
+                body = await asyncio.to_thread(cache.read, cached)
+                return httpx.Response(200, headers=cached['headers'], content=body,
+                                      request=request, extensions=response.extensions)
+            if cacheable(response.status_code, response.headers):
+                # The body is decoded by aread, so the wire headers no longer apply to it
+                body = await response.aread()
+                await asyncio.to_thread(cache.store, url, response.headers, content=body)
+                headers = [(name, value) for name, value in response.headers.multi_items()
+                           if name.lower() not in WIRE_HEADERS]
+                return httpx.Response(200, headers=headers, content=body,
+                                      request=request, extensions=response.extensions)
+            return response
+
+        async def aclose(self):
+            await self._transport.aclose()
+
+    return CachingTransport()
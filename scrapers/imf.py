@@ -3,22 +3,18 @@ from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
 
 from datetime import datetime
-import time
 from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
 
-import pandas as pd
-import base64
-import requests, os
+import os
 
 logger = setup_logging('IMF', level=logging.INFO)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'IMF'
+    # The listing is only parsed, never printed
+    LISTING_BLOCKING_PROFILE = 'text'
     ARTICLE_URL = "https://www.imf.org/en/Publications"
 
     def __init__(self, date_from, headless):
@@ -26,9 +22,8 @@ class MyScraper(BaseScraper):
         self.date_from = date_from 
 
     def fetch_articles(self):
-        self.start_browser()  # Start browser and load cookies
         self.driver.get(self.ARTICLE_URL)
-        time.sleep(2)  # Wait for page to load
+        self.wait_for_network_idle()  # Wait for page to load
 
         page_source = self.driver.execute_script("return document.documentElement.outerHTML;")
         soup = BeautifulSoup(page_source, 'html.parser')
@@ -92,7 +87,7 @@ class MyScraper(BaseScraper):
             article_description = ''
         
         article_info = {
-            'Organization': 'IMF',
+            'Organization': self.ORGANIZATION,
             'Date': article_date,
             'Title': article_title.replace(' ', '_'),
             'Link': article_link,
@@ -103,41 +98,31 @@ class MyScraper(BaseScraper):
 
 
     def download_pdf(self, article_info):
-        main_window = self.driver.current_window_handle
-    # Open the article link in a new tab
-        self.driver.execute_script("window.open('{}');".format(article_info['Link']))
-        
-        # Switch to the new tab
-        new_window = [window for window in self.driver.window_handles if window != main_window][0]
-        self.driver.switch_to.window(new_window)
-        
+        self.driver.get(article_info['Link'])
+        return self.capture_tab(article_info)
+
+    def tab_url(self, article_info):
+        return article_info['Link']
+
+    def capture_tab(self, article_info):
+        from selenium.webdriver.common.by import By
         try:
 
             # Find the PDF link that contains 'media/Files/Publications/'
-            pdf_link = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "a[href*='media/Files/Publications/']")
-                )
-            )
-            pdf_link.click()  # Click the PDF link to start download
-            time.sleep(10)  # Wait for the download to finish
-            
-            # Close the article tab
-            self.driver.close()
-            self.driver.switch_to.window(main_window)
-            
-            # Rename the downloaded file
-            self.rename_downloaded_file(article_info['file_name'])
-            return True
+            pdf_link = self.wait_for_element(By.CSS_SELECTOR, "a[href*='media/Files/Publications/']", timeout=10, condition='clickable')
+            with self.track_download() as download:
+                pdf_link.click()  # Click the PDF link to start download
+                downloaded = self.wait_for_download(download, timeout=60)  # Wait for the download to finish
+                if downloaded:
+                    download.save_as(self.download_path(article_info['file_name']))
+            return bool(downloaded)
         
         except Exception as e:
             self.logger.warning(f"Failed to download PDF for {article_info['Title']}: {e}")
-            # Close the article tab if an exception occurs
-            self.driver.close()
-            self.driver.switch_to.window(main_window)
             return False
 
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -152,6 +137,7 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,146 @@
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime
+from .utils import setup_logging
+
+logger = setup_logging('Journal', level=logging.INFO)
+
+# Stages of process_articles, in the order they complete
+STAGES = ['listed', 'downloaded', 'parsed', 'classified', 'summarized', 'stored']
+
+# Journals live outside tmp/, which is wiped at the start of every run
+JOURNAL_DIR = 'state'
+# Set to 1 to mirror the journals to S3, so that a new container resumes where the previous one died
+S3_MIRROR_ENV = 'JOURNAL_S3_MIRROR'
+# Minimum seconds between two uploads of the same journal
+MIRROR_INTERVAL = 60
+
+
+def article_key(article_info):
+    """Identity of an article in the journal, matching the duplicate check against the index."""
+    return f"{article_info['Title'].lower()}|{article_info['file_name'].lower()}"
+
+
+def journal_path(name):
+    """Local path of the journal of the scraper workspace `name`."""
+    return os.path.join(os.getcwd(), JOURNAL_DIR, f'journal_{name}.sqlite')
+
+
+def reached(entry, stage):
+    """True if a journal entry shows that `stage` was completed."""
+    return entry is not None and STAGES.index(entry['stage']) >= STAGES.index(stage)
+
+
+class ArticleJournal:
+    """Durable record of the process_articles stages each article has completed.
+
+    One SQLite file per scraper, written after every stage, together with what the
+    stage produced: the parsed text, the macro verdict and the LLM summary. A run
+    that dies halfway can then resume each article from its last completed stage
+    instead of paying for the LLM calls again.
+    """
+
+    def __init__(self, path, s3=None):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.s3 = s3 if os.getenv(S3_MIRROR_ENV) == '1' else None
+        self._lock = threading.Lock()
+        self._last_mirror = 0.0
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        if self.s3 and not os.path.exists(path):
+            if self.s3.get_state_file(self.name, path):
+                logger.info(f"Restored journal {self.name} from S3")
+
+        self._conn = None
+
+    def _db(self):
+        # Called with the lock held. Opened on first use, and again after close().
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                "key TEXT PRIMARY KEY, stage TEXT NOT NULL, info TEXT NOT NULL, "
+                "content TEXT, is_macro INTEGER, updated_at TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key):
+        """Journal entry of an article ({'stage', 'info', 'content', 'is_macro'}), or None."""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT stage, info, content, is_macro FROM articles WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        stage, info, content, is_macro = row
+        return {
+            'stage': stage,
+            'info': json.loads(info),
+            'content': content,
+            'is_macro': None if is_macro is None else bool(is_macro),
+        }
+
+    def record(self, article_info, stage, content=None, is_macro=None):
+        """Record that `stage` completed for an article, with what it produced.
+
+        Values already recorded by earlier stages are kept when not given again.
+        """
+        key = article_key(article_info)
+        with self._lock:
+            conn = self._db()
+            conn.execute(
+                "INSERT INTO articles (key, stage, info, content, is_macro, updated_at) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET stage = excluded.stage, info = excluded.info, "
+                # Stored articles no longer need their parsed text
+                "content = CASE WHEN excluded.stage = 'stored' THEN NULL ELSE COALESCE(excluded.content, articles.content) END, "
+                "is_macro = COALESCE(excluded.is_macro, articles.is_macro), updated_at = excluded.updated_at",
+                (key, stage, json.dumps(article_info), content,
+                 None if is_macro is None else int(is_macro), datetime.now().isoformat(timespec='seconds')),
+            )
+            conn.commit()
+        # Summaries are what a lost journal costs the most to redo
+        if stage in ('summarized', 'stored'):
+            self.mirror()
+
+    def reset(self, article_info):
+        """Forget an article, so that it is processed from scratch."""
+        with self._lock:
+            conn = self._db()
+            conn.execute("DELETE FROM articles WHERE key = ?", (article_key(article_info),))
+            conn.commit()
+
+    def mirror(self, force=False):
+        """Upload a consistent copy of the journal to S3, at most once every MIRROR_INTERVAL seconds."""
+        if not self.s3:
+            return
+        if not force and time.monotonic() - self._last_mirror < MIRROR_INTERVAL:
+            return
+        self._last_mirror = time.monotonic()
+        fd, snapshot = tempfile.mkstemp(suffix='.sqlite')
+        os.close(fd)
+        try:
+            target = sqlite3.connect(snapshot)
+            with self._lock:
+                self._db().backup(target)
+            target.close()
+            self.s3.store_state_file(self.name, snapshot)
+        except Exception as e:
+            logger.warning(f"Unable to mirror journal {self.name} to S3: {e}")
+        finally:
+            os.remove(snapshot)
+
+    def close(self):
+        """Upload the journal one last time and close its connection, reopened if it is used again."""
+        if self._conn is None:
+            return
+        self.mirror(force=True)
+        with self._lock:
+            self._conn.close()
+            self._conn = None
@@ -1,50 +1,94 @@
 from .base_scraper import BaseScraper
 from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
+from .async_runner import run_scraper
 
 from datetime import datetime
-import time
+import asyncio
 from urllib.parse import urljoin
 import argparse
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
-import pandas as pd
-import base64
-import requests, os
 
 logger = setup_logging('JPMorgan', level=logging.INFO)
 
 class MyScraper(BaseScraper):
-    API_URL_1 = 'https://www.jpmorgan.com/services/json/v1/dynamic-grid.service/parent=jpmorgan/global/US/en/insights/economy&comp=root/content-parsys/dynamic_grid_copy&page=p1.json'
-    
-    API_URL_2 = 'https://www.jpmorgan.com/services/json/v1/dynamic-grid.service/parent=jpmorgan/global/US/en/insights/markets&comp=root/content-parsys/dynamic_grid_copy_co&page=p1.json'
+    ORGANIZATION = 'JPMorgan'
+    # Dynamic-grid feeds of the economy and markets insights, one JSON page (p1, p2, ...) at a time
+    FEED_URLS = [
+        'https://www.jpmorgan.com/services/json/v1/dynamic-grid.service/parent=jpmorgan/global/US/en/insights/economy&comp=root/content-parsys/dynamic_grid_copy&page=p{page}.json',
+        'https://www.jpmorgan.com/services/json/v1/dynamic-grid.service/parent=jpmorgan/global/US/en/insights/markets&comp=root/content-parsys/dynamic_grid_copy_co&page=p{page}.json',
+    ]
+    # Pages read at most per feed and run
+    MAX_PAGES = 10
 
     def __init__(self, date_from, headless=True):
         super().__init__('JPMorgan', 'https://www.jpmorgan.com', headless=headless)
         self.date_from = date_from
 
     def fetch_articles(self):
-        response = requests.get(self.API_URL_1)
-        if response.status_code == 200:
-            items1 =  response.json().get("items", [])        
-        response = requests.get(self.API_URL_2)
-        if response.status_code == 200:
-            items2 =  response.json().get("items", [])                
-        
-        articles = items1 + items2 
-        # remove articles < date_from for faster processing
+        """Items of all feeds since date_from, the feeds read in parallel, each page by page."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(self.FEED_URLS)) as executor:
+            feeds = list(executor.map(self._fetch_feed, self.FEED_URLS))
+        return self._filter_items([item for items in feeds for item in items])
+
+    def _fetch_feed(self, feed_url):
+        items = []
+        for page in range(1, self.MAX_PAGES + 1):
+            self.check_deadline()
+            response = self.http.get(feed_url.format(page=page), timeout=self.HTTP_TIMEOUT)
+            if response.status_code != 200:
+                # Past the last page the service answers 404
+                break
+            page_items = response.json().get("items", [])
+            items.extend(page_items)
+            if self._last_page(page_items):
+                break
+        return items
+
+    async def afetch_articles(self, http):
+        feeds = await asyncio.gather(*(self._afetch_feed(http, feed_url) for feed_url in self.FEED_URLS))
+        return self._filter_items([item for items in feeds for item in items])
+
+    async def _afetch_feed(self, http, feed_url):
+        items = []
+        for page in range(1, self.MAX_PAGES + 1):
+            response = await http.get(feed_url.format(page=page))
+            if response.status_code != 200:
+                break
+            page_items = response.json().get("items", [])
+            items.extend(page_items)
+            if self._last_page(page_items):
+                break
+        return items
+
+    def _last_page(self, items):
+        """True for an empty page, or one reaching back past date_from (items are listed newest first)."""
+        dates = [self._item_date(item) for item in items]
+        dates = [date for date in dates if date]
+        return not items or (bool(dates) and min(dates) < self.date_from)
+
+    @staticmethod
+    def _item_date(item):
+        try:
+            return datetime.strptime(item["date"], "%B %d, %Y").strftime("%Y-%m-%d")
+        except (KeyError, ValueError):
+            return None
+
+    def _filter_items(self, articles):
+        # remove articles < date_from for faster processing, and the ones listed in both feeds
         filtered_articles = []
+        seen_links = set()
         for article in articles:
-            try:
-                # Attempt to parse the date and compare
-                article_date = datetime.strptime(article["date"], "%B %d, %Y").strftime("%Y-%m-%d")
-                if article_date > self.date_from:
-                    filtered_articles.append(article)
-            except (KeyError, ValueError):
-                # Bypass if 'date' key is missing or the date format is invalid
+            # Bypass if 'date' key is missing or the date format is invalid
+            article_date = self._item_date(article)
+            if article_date is None or article_date <= self.date_from:
+                continue
+            link = urljoin('https://www.jpmorgan.com', article.get("link", ""))
+            if link in seen_links:
                 continue
+            seen_links.add(link)
+            filtered_articles.append(article)
 
         return filtered_articles
 
@@ -54,7 +98,7 @@ class MyScraper(BaseScraper):
         description = item.get("description", "")
         link = urljoin('https://www.jpmorgan.com', link )
         article_info = {
-            'Organization': 'JPMorgan',
+            'Organization': self.ORGANIZATION,
             'Date': article_date,
             'Title': item["title"].replace(' ', '_'),
             'Link': link,
@@ -65,42 +109,27 @@ class MyScraper(BaseScraper):
 
     def download_pdf(self, article_info):
         if article_info['Link'].endswith('.pdf'):
-            pdf_response = requests.get(article_info['Link'])
-            if pdf_response.status_code == 200:
-                pdf_path = os.path.join('tmp', article_info['file_name'])
-                with open(pdf_path, 'wb') as f:
-                    f.write(pdf_response.content)
-                return True
-            
+            return self.fetch_to_file(article_info['Link'], article_info['file_name'])
         else:
             try:
                 self.driver.get(article_info['Link'])
-                WebDriverWait(self.driver, 10).until(
-                    lambda d: d.execute_script("return document.readyState") == "complete"
-                )
-                time.sleep(5)
-
-                result = self.driver.execute_cdp_cmd("Page.printToPDF", {
-                    "landscape": False,
-                    "displayHeaderFooter": False,
-                    "printBackground": True,
-                    "preferCSSPageSize": True,
-                })
-                pdf_base64 = result['data']
-                with open('tmp/data.pdf', 'wb') as f:
-                    f.write(base64.b64decode(pdf_base64))
-
-                # Wait for file to be fully written and verify it exists
-                WebDriverWait(self.driver, 10).until(lambda x: os.path.exists('tmp/data.pdf') and os.path.getsize('tmp/data.pdf') > 0)
-
-                self.rename_downloaded_file(article_info['file_name'])
+                self.wait_for_network_idle()
+
+                self.capture_pdf(article_info['file_name'])
+
                 return True
             except Exception as e:
                 logger.error(f"Failed to print article: {e}")
 
         return None
+
+    async def adownload_pdf(self, http, article_info):
+        if article_info['Link'].endswith('.pdf'):
+            return await self.afetch_to_file(http, article_info['Link'], article_info['file_name'])
+        return await super().adownload_pdf(http, article_info)
     
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -115,6 +144,12 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
+
+
+async def amain(date_from, http, llm, overwrite=False):
+    """Async entry point used by run_scrapers --async-http."""
+    return await run_scraper(lambda date_from: MyScraper(date_from=date_from, headless=True), date_from, http, llm, overwrite)
 
 
 if __name__ == '__main__':
@@ -4,10 +4,9 @@ from langchain.prompts import PromptTemplate
 from pydantic import BaseModel, Field
 from langchain_core.output_parsers import JsonOutputParser
 from dotenv import load_dotenv, find_dotenv
-import tiktoken
 from openai import OpenAI
 import re
-enc = tiktoken.encoding_for_model("gpt-4o-mini")
+from .tokenizer import get_encoder
 
 load_dotenv(find_dotenv())
 
@@ -36,7 +35,7 @@ def clean_article(text, max_chunk_tokens=125000, overlap_tokens=200):
         }
 
         # Initialize tokenizer
-        tokenizer = enc  # Tiktoken tokenizer initialized earlier
+        tokenizer = get_encoder()  # Shared process-wide tokenizer
         # Tokenize the text
         tokens = tokenizer.encode(text)
         total_tokens = len(tokens)
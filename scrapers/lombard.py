@@ -3,36 +3,37 @@ from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
 
 from datetime import datetime
-import time
 from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
-import pandas as pd
-import base64
-import requests, os
+import os
 
 logger = setup_logging('LombardOdier', level=logging.INFO)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'LombardOdier'
+    # Cookie consent is kept across runs
+    PERSIST_SESSION = True
     URL = 'https://www.lombardodier.com/home/about-us/insights.html?categories=investment-insights&tags='
     
     def __init__(self, headless=True):
         super().__init__('LombardOdier', 'https://www.lombardodier.com', headless=headless)
 
     def fetch_articles(self):
-        self.start_browser()
+        from selenium.webdriver.common.by import By
         self.driver.get(self.URL)
-        cookie_button = WebDriverWait(self.driver, 3).until(
-                EC.element_to_be_clickable((By.CLASS_NAME, "accept"))
-            )
-        cookie_button.click()
+        if not self.has_consent():
+            cookie_button = self.wait_for_element(By.CLASS_NAME, "accept", timeout=3, condition='clickable')
+            cookie_button.click()
+            self.record_consent()
+        # Scroll until the infinite list stops growing (at most 7 pages)
         for _ in range(7):
-            self.driver.execute_script("window.scrollBy(0, 2000);")  # Scroll down by 500 pixels
-            time.sleep(1)  # Wait for one second
+            height = self.driver.execute_script("return document.body.scrollHeight;")
+            self.driver.execute_script("window.scrollBy(0, 2000);")
+            self.wait_for_network_idle(timeout=5)
+            if self.driver.execute_script("return document.body.scrollHeight;") == height:
+                break
         page_source = self.driver.execute_script("return document.documentElement.outerHTML;")
         soup = BeautifulSoup(page_source, 'html.parser')
         article_blocks = soup.find_all('div', class_ = 'overviewbloc js-item col-12 col-md-12 col-lg-8')
@@ -44,7 +45,7 @@ class MyScraper(BaseScraper):
         article_link = article.find("a", href=True)["href"]
         article_title = article.find("h3", class_="overviewbloc-title").get_text(strip=True)
         article_info = {
-                    'Organization': 'LombardOdier',
+                    'Organization': self.ORGANIZATION,
                     'Date': article_date,
                     'Title': article_title.replace(' ', '_'),
                     'Link': self.base_url + article_link,
@@ -55,7 +56,7 @@ class MyScraper(BaseScraper):
 
     def download_pdf(self, article_info):
         self.driver.get(article_info['Link'])
-        time.sleep(2)
+        self.wait_for_document_ready()
         page_source = self.driver.execute_script("return document.documentElement.outerHTML;")
 
         soup = BeautifulSoup(page_source, 'html.parser')
@@ -63,27 +64,13 @@ class MyScraper(BaseScraper):
         pdf_link = urljoin(self.base_url, relative_pdf_link)
 
         if pdf_link:
-            pdf_response = requests.get( pdf_link)
-            if pdf_response.status_code == 200:
-                pdf_path = os.path.join('tmp', article_info['file_name'])
-                with open(pdf_path, 'wb') as f:
-                    f.write(pdf_response.content)
-                return True
+            return self.fetch_to_file(pdf_link, article_info['file_name'])
         else:
             try:
                 self.driver.get(article_info['Link'])
-                time.sleep(2)  # wait till loading finish
-                result = self.driver.execute_cdp_cmd("Page.printToPDF", {
-                    "landscape": False,
-                    "displayHeaderFooter": False,
-                    "printBackground": True,
-                    "preferCSSPageSize": True,
-                })
-                pdf_base64 = result['data']
-                with open('tmp/data.pdf', 'wb') as f:
-                    f.write(base64.b64decode(pdf_base64))
-
-                self.rename_downloaded_file(article_info['file_name'])
+                self.wait_for_network_idle()  # wait till loading finish
+                self.capture_pdf(article_info['file_name'])
+
                 return True
             except Exception as e:
                 logger.error(f"Failed to print article: {e}")
@@ -91,6 +78,7 @@ class MyScraper(BaseScraper):
         return None
     
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -105,6 +93,7 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
 
 
 if __name__ == '__main__':
@@ -1,18 +1,35 @@
-import boto3
 import os, uuid, json
 import logging
+import threading
 from .utils import setup_logging
 
-import pandas as pd 
-
 
 # Set up logging
 logger = setup_logging('Macro-Handler', level=logging.INFO)
 
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """Process-wide S3 client.
+
+    Creating clients from boto3's default session is not thread-safe (scrapers run in
+    threads with --workers), while a created client is: it is built once and shared.
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                import boto3
+
+                _s3_client = boto3.session.Session().client('s3')
+    return _s3_client
+
 
 class S3MacroManager:
     def __init__(self, macro_prefix= "macro" , bucket_name='msai'):
-        self.s3 = boto3.client('s3')
+        self.s3 = get_s3_client()
         self.bucket = bucket_name
         self.prefix = macro_prefix
 
@@ -33,10 +50,10 @@ class S3MacroManager:
             logger.warning(f"S3FileManager::_read_file: Unable reading file '{key}':{e}")
             return None
     
-    def store_pdf(self, date, file_name):
+    def store_pdf(self, date, file_name, local_dir='tmp'):
         key = f"{self.prefix}/pdfs/{date}/{file_name}"
         try:
-            with open('tmp/' + file_name, 'rb') as pdf_data:
+            with open(os.path.join(local_dir, file_name), 'rb') as pdf_data:
                 response = self.s3.upload_fileobj( pdf_data, self.bucket, key )
             logger.info(f"File '{file_name}' written successfully in {self.bucket}.")
             return True
@@ -59,6 +76,27 @@ class S3MacroManager:
             return False
 
 
+    def store_state_file(self, name, local_path):
+        """Upload a runner state file (e.g. an article journal) under the state/ prefix."""
+        key = f"{self.prefix}/state/{name}"
+        try:
+            self.s3.upload_file(local_path, self.bucket, key)
+            logger.info(f"File '{key}' written successfully in {self.bucket}.")
+            return True
+        except Exception as e:
+            logger.error(f"S3FileManager::store_state_file Error writing file: {e}")
+            return False
+
+    def get_state_file(self, name, local_path):
+        """Download a runner state file to `local_path`. Returns False if it does not exist."""
+        key = f"{self.prefix}/state/{name}"
+        try:
+            self.s3.download_file(self.bucket, key, local_path)
+            return True
+        except Exception as e:
+            logger.info(f"State file '{key}' not available: {e}")
+            return False
+
     def get_articles_index( self  ):
             key = f"{self.prefix}/structure/articles_info.json"
             data =  self._read_file(key)
@@ -66,6 +104,8 @@ class S3MacroManager:
             return json.loads(data)
 
     def append_articles_to_index( self, data):
+        import pandas as pd
+
         articles_index = self.get_articles_index()
         articles_index.extend( data )
         df = pd.DataFrame(articles_index)
@@ -76,7 +116,10 @@ class S3MacroManager:
         # print( df_unique_subset.sort_values( by=['Date'], ascending = False ) )
         new_articles_info = df_unique_subset.to_json( orient= "records")
         
-        self.store_articles_index(new_articles_info)
+        if self.store_articles_index(new_articles_info):
+            self.store_watermarks(self._compute_watermarks(df_unique_subset))
+            return True
+        return False
 
     def store_articles_index( self, data ):
         key = f"{self.prefix}/structure/articles_info.json"
@@ -91,6 +134,8 @@ class S3MacroManager:
 
 
     def remove_articles(self, date_from, date_to, organization=None):
+        import pandas as pd
+
         articles_index = self.get_articles_index()
         df = pd.DataFrame(articles_index)
         
@@ -111,7 +156,8 @@ class S3MacroManager:
 
         # Store the updated articles index
         new_articles_info = df_cleaned.to_json(orient="records")
-        self.store_articles_index(new_articles_info)
+        if self.store_articles_index(new_articles_info):
+            self.store_watermarks(self._compute_watermarks(df_cleaned))
 
 
     def _delete_files(self, matching_files):
@@ -137,25 +183,48 @@ class S3MacroManager:
                 logger.warning(f"Error removing PDF file {pdf_key}: {e}")
 
 
+    def _compute_watermarks(self, df):
+        """Most recent article date for each organization of an articles index DataFrame."""
+        # Clean up the DataFrame to ensure it has proper Date and Organization fields
+        df_cleaned = df.dropna(subset=['Organization', 'Date'])
+
+        # Group by Organization and get the most recent date for each
+        return df_cleaned.groupby('Organization')['Date'].max().to_dict()
+
+    def store_watermarks(self, watermarks):
+        """Store the {Organization: latest Date} watermarks next to the articles index."""
+        key = f"{self.prefix}/structure/watermarks.json"
+        content = json.dumps(watermarks, sort_keys=True)
+        try:
+            self.s3.put_object(Body=content, Bucket=self.bucket, Key=key)
+            logger.info(f"File '{key}' written successfully in {self.bucket}.")
+            return True
+        except Exception as e:
+            logger.error(f"S3FileManager::store_file Error writing file: {e}")
+            return False
+
+    def get_watermarks(self):
+        """
+        Returns {Organization: latest Date} from the watermarks file, which is kept up to
+        date on every index write. The file is rebuilt from the articles index if missing.
+        """
+        key = f"{self.prefix}/structure/watermarks.json"
+        watermarks = self._read_file(key)
+        if watermarks is None:
+            import pandas as pd
+
+            logger.info("Watermarks file not found, rebuilding it from the articles index")
+            watermarks = self._compute_watermarks(pd.DataFrame(self.get_articles_index()))
+            self.store_watermarks(watermarks)
+        return watermarks
+
     def get_latest_scrapping_date(self):
         """
-        Returns a dictionary of the most recent article date for each organization.
+        Returns a list of {'Organization', 'Date'} records with the most recent article date for each organization.
         """
         try:
-            # Retrieve the articles index data
-            articles_index = self.get_articles_index()
-            df = pd.DataFrame(articles_index)
-            
-            # Clean up the DataFrame to ensure it has proper Date and Organization fields
-            df_cleaned = df.dropna(subset=['Organization', 'Date'])
-            
-            # Group by Organization and get the most recent date for each
-            recent_dates = df_cleaned.groupby('Organization')['Date'].max().reset_index()
-            
-            # Convert to a list of dictionaries, or a more usable format
-            recent_dates_list = recent_dates.to_dict(orient='records')
-            
-            return recent_dates_list
+            watermarks = self.get_watermarks()
+            return [{'Organization': organization, 'Date': date} for organization, date in sorted(watermarks.items())]
         
         except Exception as e:
             logger.error(f"Error getting most recent dates for each organization: {e}")
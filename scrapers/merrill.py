@@ -1,45 +1,99 @@
 from .base_scraper import BaseScraper
 from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
+from .async_runner import run_scraper
 
 from datetime import datetime
-import time
+import asyncio
 from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
 
-import pandas as pd
-import requests, os
+import os
 
 logger = setup_logging('Merrill', level=logging.INFO)
 
 class MyScraper(BaseScraper):
-    URL = 'https://www.ml.com/capital-market-outlook/_jcr_content/bulletin-tilespattern.pagination.recent.json/1.html'
-    
-    def __init__(self, headless=True):
+    ORGANIZATION = 'Merrill'
+    # Pages of the Capital Market Outlook listing, newest issues first
+    PAGE_URL = 'https://www.ml.com/capital-market-outlook/_jcr_content/bulletin-tilespattern.pagination.recent.json/{page}.html'
+    # Listing pages fetched at once, and at most per run
+    PREFETCH_PAGES = 4
+    MAX_PAGES = 40
+
+    def __init__(self, date_from, headless=True):
         super().__init__('Merrill', 'https://www.ml.com', headless=headless)
+        self.date_from = date_from
 
     def fetch_articles(self):
-        response = requests.get(self.URL)
-        if response.status_code == 200:
-            return response.json().get('pages', [])
-        else:
-            logger.error(f"Failed to retrieve the page. Status code: {response.status_code}")
+        """Issues published since date_from, read PREFETCH_PAGES listing pages at a time."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        articles = []
+        with ThreadPoolExecutor(max_workers=self.PREFETCH_PAGES) as executor:
+            for first in range(1, self.MAX_PAGES + 1, self.PREFETCH_PAGES):
+                self.check_deadline()
+                pages = list(executor.map(self._fetch_page, self._window(first)))
+                if self._collect(articles, pages):
+                    break
+        return articles
+
+    async def afetch_articles(self, http):
+        articles = []
+        for first in range(1, self.MAX_PAGES + 1, self.PREFETCH_PAGES):
+            pages = await asyncio.gather(*(self._afetch_page(http, page) for page in self._window(first)))
+            if self._collect(articles, pages):
+                break
+        return articles
+
+    def _window(self, first):
+        return range(first, min(first + self.PREFETCH_PAGES, self.MAX_PAGES + 1))
+
+    def _fetch_page(self, page):
+        response = self.http.get(self.PAGE_URL.format(page=page), timeout=self.HTTP_TIMEOUT)
+        return self._page_items(page, response.status_code, response.json)
+
+    async def _afetch_page(self, http, page):
+        response = await http.get(self.PAGE_URL.format(page=page))
+        return self._page_items(page, response.status_code, response.json)
+
+    def _page_items(self, page, status_code, json):
+        if status_code != 200:
+            if page == 1:
+                logger.error(f"Failed to retrieve the page. Status code: {status_code}")
             return []
+        return json().get('pages', [])
+
+    def _collect(self, articles, pages):
+        """Add the listing pages' issues since date_from to `articles`; True once past the last page needed."""
+        for items in pages:
+            dates = [self._listed_date(item) for item in items]
+            # Issues without a readable date are kept, for extract_article_info to report
+            articles.extend(item for item, date in zip(items, dates) if date is None or date >= self.date_from)
+            dates = [date for date in dates if date]
+            if not items or (dates and min(dates) < self.date_from):
+                return True
+        return False
+
+    def _listed_date(self, article):
+        try:
+            return self._issue_date(article)
+        except (KeyError, ValueError):
+            return None
+
+    @staticmethod
+    def _issue_date(article):
+        parsed_date = BeautifulSoup(article['author'], 'html.parser').text.strip()
+        return datetime.strptime(parsed_date, "%B %d, %Y").strftime("%Y-%m-%d")
 
     def extract_article_info(self, article):
-        parsed_date = BeautifulSoup(article['author'], 'html.parser').text.strip()
-        article_date = datetime.strptime(parsed_date, "%B %d, %Y").strftime("%Y-%m-%d")
+        article_date = self._issue_date(article)
         path = article.get('path', 'No Path')
         description = BeautifulSoup(article.get('subtitle', ''), 'html.parser').text
         article_url = f"{self.base_url}/{path}.recent.html"
 
         article_info = {
-            'Organization': 'Merrill',
+            'Organization': self.ORGANIZATION,
             'Date': article_date,
             'Title': article['title'].replace(' ', '_'),
             'Link': article_url,
@@ -51,20 +105,28 @@ class MyScraper(BaseScraper):
 
 
     def download_pdf(self, article_info):
-        self.driver.get(article_info['Link'])
-        time.sleep(1)
-        page_source = self.driver.execute_script("return document.documentElement.outerHTML;")
-
-        soup = BeautifulSoup(page_source, 'html.parser')        
-        pdf_link = soup.find('a', href=lambda href: href and href.endswith('.pdf'))
-        pdf_response = requests.get( self.base_url + pdf_link['href'])
-        if pdf_response.status_code == 200:
-            pdf_path = os.path.join('tmp', article_info['file_name'])
-            with open(pdf_path, 'wb') as f:
-                f.write(pdf_response.content)
-            return True
+        # The PDF link is in the served HTML: no browser needed
+        page_source = self.fetch_html(article_info['Link'])
+        pdf_link = self._find_pdf_link(page_source) if page_source else None
+        if not pdf_link:
+            self.logger.warning(f"No PDF link found for {article_info['Title']}")
+            return False
+        return self.fetch_to_file(self.base_url + pdf_link['href'], article_info['file_name'])
+
+    async def adownload_pdf(self, http, article_info):
+        page_source = await self.afetch_html(http, article_info['Link'])
+        pdf_link = self._find_pdf_link(page_source) if page_source else None
+        if not pdf_link:
+            self.logger.warning(f"No PDF link found for {article_info['Title']}")
+            return False
+        return await self.afetch_to_file(http, self.base_url + pdf_link['href'], article_info['file_name'])
+
+    def _find_pdf_link(self, page_source):
+        soup = BeautifulSoup(page_source, 'html.parser')
+        return soup.find('a', href=lambda href: href and href.endswith('.pdf'))
 
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -74,11 +136,17 @@ def main(date_from, headless=False, overwrite=False ):
 
     articles_index_df = pd.DataFrame(S3MacroManager().get_articles_index())
 
-    scraper = MyScraper(headless=headless) 
+    scraper = MyScraper(date_from=date_from, headless=headless) 
     new_articles = scraper.process_articles(articles_index_df, date_from, overwrite)
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
+
+
+async def amain(date_from, http, llm, overwrite=False):
+    """Async entry point used by run_scrapers --async-http."""
+    return await run_scraper(lambda date_from: MyScraper(date_from=date_from, headless=True), date_from, http, llm, overwrite)
 
 
 if __name__ == '__main__':
@@ -3,37 +3,34 @@ from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
 
 from datetime import datetime
-import time
 from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
 
-import pandas as pd
-import requests, os, base64
-import time, random
+import os
 
 logger = setup_logging('MorganStalney', level=logging.ERROR)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'MorganStanley'
+    # Cookie consent is kept across runs
+    PERSIST_SESSION = True
     URL = 'https://www.morganstanley.com/im/en-us/institutional-investor/insights.html'
     
     def __init__(self, headless=True):
         super().__init__('MorganStalney', self.URL, headless=headless)
 
     def fetch_articles(self):
+        from selenium.webdriver.common.by import By
         self.logger.debug("Navigating to URL")
         self.driver.get(self.URL)
             
-        accept_all_button = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.ID, "_evidon-accept-button"))
-        )
-        self.logger.debug("Found cookie acceptance button")
-        accept_all_button.click()
-        self.logger.debug("Clicked cookie acceptance button")
+        if not self.has_consent():
+            accept_all_button = self.wait_for_element(By.ID, "_evidon-accept-button", timeout=10)
+            self.logger.debug("Found cookie acceptance button")
+            accept_all_button.click()
+            self.logger.debug("Clicked cookie acceptance button")
+            self.record_consent()
             
         page_content = self.driver.page_source
         soup = BeautifulSoup(page_content, 'html.parser')
@@ -57,7 +54,7 @@ class MyScraper(BaseScraper):
         dt = article_date.strftime('%Y-%m-%d')
         link = title.find('a')['href'] if title and title.find('a') else 'No Link'
         article_info = {
-            'Organization': 'MorganStanley',
+            'Organization': self.ORGANIZATION,
             'Date': dt,
             'Title': title.find('a').get_text(strip=True).replace(' ', '_'),
             'Author': author_div.get_text(strip=True) if author_div else 'No Author',
@@ -69,36 +66,21 @@ class MyScraper(BaseScraper):
 
     def download_pdf(self, article_info):
         self.driver.get(article_info['Link'])
-        time.sleep(1)
+        self.wait_for_document_ready()
         page_source = self.driver.execute_script("return document.documentElement.outerHTML;")
 
         soup = BeautifulSoup(page_source, 'html.parser')        
         pdf_link = soup.find('a', href=lambda href: href and '.pdf' in href)
         if pdf_link:
-            pdf_response = requests.get( 'https://www.morganstanley.com' + pdf_link['href'])
-            time.sleep(2)
-            if pdf_response.status_code == 200:
-                pdf_path = os.path.join('tmp', article_info['file_name'])
-                with open(pdf_path, 'wb') as f:
-                    f.write(pdf_response.content)
-                return True
+            return self.fetch_to_file('https://www.morganstanley.com' + pdf_link['href'], article_info['file_name'])
         else:
-            result = self.driver.execute_cdp_cmd("Page.printToPDF", {
-                "landscape": False,
-                "displayHeaderFooter": False,
-                "printBackground": True,
-                "preferCSSPageSize": True,
-            })
-
-            pdf_base64 = result['data']
-            with open('tmp/data.pdf', 'wb') as f:
-                f.write(base64.b64decode(pdf_base64))
-                self.rename_downloaded_file(article_info['file_name'])
-                return True
+            self.capture_pdf(article_info['file_name'])
+            return True
 
 
     
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -113,6 +95,7 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,149 @@
+import hashlib
+import logging
+import os
+from collections import namedtuple
+from .http_cache import BYPASS_EXTENSION, cacheable, get_http_cache
+from .utils import setup_logging
+
+logger = setup_logging('PDFDownload', level=logging.INFO)
+
+# Bytes read from the connection (or the cache) and written to disk at a time
+CHUNK_SIZE = 1 << 16
+# Larger responses are aborted: no research PDF comes close, a runaway stream would
+MAX_PDF_BYTES = 200 * 1024 * 1024
+# Every PDF starts with this, give or take a few bytes of junk the readers tolerate
+PDF_MAGIC = b'%PDF'
+MAGIC_WINDOW = 1024
+
+Download = namedtuple('Download', ['path', 'size', 'sha256', 'from_cache'])
+
+
+class DownloadRejected(Exception):
+    """The response is not a PDF, or is larger than allowed."""
+
+
+class PDFWriter:
+    """Writes a PDF to `path` chunk by chunk, hashing it on the way.
+
+    The file is written as `<path>.part` and only renamed once complete. The `%PDF`
+    magic is checked in the first kilobyte, so an HTML error page or a login wall
+    served with a 200 is rejected after one chunk rather than read to the end.
+    """
+
+    def __init__(self, path, url, max_bytes=MAX_PDF_BYTES):
+        self.path = path
+        self.url = url
+        self.max_bytes = max_bytes
+        self.partial_path = f"{path}.part"
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+        self._head = b''
+        self._file = None
+
+    def check_headers(self, headers):
+        content_type = headers.get('Content-Type', '').lower()
+        if content_type.startswith(('text/html', 'application/json')):
+            raise DownloadRejected(f"{self.url} is not a PDF (Content-Type: {content_type})")
+        length = headers.get('Content-Length')
+        if length and length.isdigit() and int(length) > self.max_bytes:
+            raise DownloadRejected(f"{self.url} is {int(length) / 1e6:.0f}MB, above the {self.max_bytes / 1e6:.0f}MB limit")
+
+    def write(self, chunk):
+        if not chunk:
+            return
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise DownloadRejected(f"{self.url} is larger than the {self.max_bytes / 1e6:.0f}MB limit")
+        if len(self._head) < MAGIC_WINDOW:
+            self._head += chunk[:MAGIC_WINDOW - len(self._head)]
+            if len(self._head) >= MAGIC_WINDOW:
+                self._check_magic()
+        if self._file is None:
+            self._file = open(self.partial_path, 'wb')
+        self._file.write(chunk)
+        self._sha256.update(chunk)
+
+    def _check_magic(self):
+        if PDF_MAGIC not in self._head:
+            raise DownloadRejected(f"{self.url} is not a PDF (starts with {self._head[:16]!r})")
+
+    def finish(self, from_cache=False):
+        self._check_magic()
+        self._file.close()
+        os.replace(self.partial_path, self.path)
+        return Download(self.path, self.size, self._sha256.hexdigest(), from_cache)
+
+    def abort(self):
+        if self._file is not None:
+            self._file.close()
+        if os.path.exists(self.partial_path):
+            os.remove(self.partial_path)
+
+    def copy_from(self, source_path):
+        with open(source_path, 'rb') as f:
+            while chunk := f.read(CHUNK_SIZE):
+                self.write(chunk)
+
+
+def _status_error(url, status_code):
+    return DownloadRejected(f"Failed to download {url}: status code {status_code}")
+
+
+def stream_pdf(session, url, path, timeout=None, max_bytes=MAX_PDF_BYTES):
+    """Download the PDF at `url` into `path` without holding it in memory.
+
+    A cached copy is revalidated with a conditional request (scrapers.http_cache) and
+    copied on a 304. Returns a Download; raises DownloadRejected for an error status,
+    a response that is not a PDF or one above `max_bytes`.
+    """
+    cache = get_http_cache()
+    cached = cache.lookup(url) if cache else None
+    headers = cache.conditional_headers(cached) if cached else {}
+    writer = PDFWriter(path, url, max_bytes)
+    try:
+        with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+            if response.status_code == 304 and cached:
+                writer.copy_from(cache.body_path(cached['key']))
+                cache.touch(cached)
+                return writer.finish(from_cache=True)
+            if response.status_code != 200:
+                raise _status_error(url, response.status_code)
+            writer.check_headers(response.headers)
+            for chunk in response.iter_content(CHUNK_SIZE):
+                writer.write(chunk)
+            download = writer.finish()
+        if cache and cacheable(response.status_code, response.headers):
+            cache.store(url, response.headers, path=path)
+        return download
+    except BaseException:
+        writer.abort()
+        raise
+
+
+async def astream_pdf(http, url, path, max_bytes=MAX_PDF_BYTES):
+    """Async variant of stream_pdf using the shared httpx.AsyncClient `http`."""
+    import asyncio
+
+    cache = get_http_cache()
+    cached = await asyncio.to_thread(cache.lookup, url) if cache else None
+    headers = cache.conditional_headers(cached) if cached else {}
+    writer = PDFWriter(path, url, max_bytes)
+    try:
+        # The body is cached here once on disk, not read into memory by the caching transport
+        async with http.stream('GET', url, headers=headers, extensions={BYPASS_EXTENSION: True}) as response:
+            if response.status_code == 304 and cached:
+                await asyncio.to_thread(writer.copy_from, cache.body_path(cached['key']))
+                await asyncio.to_thread(cache.touch, cached)
+                return writer.finish(from_cache=True)
+            if response.status_code != 200:
+                raise _status_error(url, response.status_code)
+            writer.check_headers(response.headers)
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                writer.write(chunk)
+            download = writer.finish()
+        if cache and cacheable(response.status_code, response.headers):
+            await asyncio.to_thread(cache.store, url, response.headers, path=path)
+        return download
+    except BaseException:
+        writer.abort()
+        raise
@@ -0,0 +1,118 @@
+import logging
+import queue
+import threading
+from .utils import setup_logging
+
+logger = setup_logging('Pipeline', level=logging.INFO)
+
+# Marks the end of the stream on a queue
+_DONE = object()
+
+
+class Stage:
+    """A named pipeline step run by `workers` threads.
+
+    `func` receives one item and returns the item to pass to the next stage,
+    or None to drop it. With a `batch_size`, `func` receives a list of up to
+    `batch_size` items (those already waiting) and returns an iterable of results,
+    which are passed on as they are produced.
+    """
+
+    def __init__(self, name, func, workers=1, batch_size=None):
+        self.name = name
+        self.func = func
+        self.workers = max(1, int(workers))
+        self.batch_size = max(1, int(batch_size)) if batch_size else None
+
+
+class Pipeline:
+    """Stream items through a chain of stages connected by bounded queues.
+
+    Every stage runs in its own worker threads, so stages overlap: while one item
+    is being summarized the next one is already downloading. The bounded queues
+    keep a fast stage from running too far ahead of a slow one.
+    """
+
+    def __init__(self, stages, queue_size=4):
+        self.stages = stages
+        self.queue_size = max(1, int(queue_size))
+
+    def run(self, items):
+        """Feed `items` (any iterable) through the stages and yield the results of the last stage as they complete."""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._feed, args=(items, queues[0]), name='pipeline-feed', daemon=True)]
+
+        for idx, stage in enumerate(self.stages):
+            remaining = {'workers': stage.workers}
+            lock = threading.Lock()
+            for n in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[idx], queues[idx + 1], remaining, lock),
+                    name=f"pipeline-{stage.name}-{n}",
+                    daemon=True,
+                ))
+
+        for thread in threads:
+            thread.start()
+
+        output = queues[-1]
+        while True:
+            item = output.get()
+            if item is _DONE:
+                break
+            yield item
+
+        for thread in threads:
+            thread.join()
+
+    def _feed(self, items, out_queue):
+        try:
+            for item in items:
+                out_queue.put(item)
+        except Exception as e:
+            logger.exception(f"Error producing pipeline items: {e}")
+        finally:
+            out_queue.put(_DONE)
+
+    def _work(self, stage, in_queue, out_queue, remaining, lock):
+        while True:
+            item = in_queue.get()
+            if item is _DONE:
+                # Let the sibling workers see the end of the stream as well
+                in_queue.put(_DONE)
+                break
+            try:
+                if stage.batch_size:
+                    for result in stage.func(self._batch(item, in_queue, stage.batch_size)):
+                        if result is not None:
+                            out_queue.put(result)
+                    continue
+                result = stage.func(item)
+            except Exception as e:
+                logger.exception(f"Stage '{stage.name}' failed: {e}")
+                continue
+            if result is not None:
+                out_queue.put(result)
+
+        with lock:
+            remaining['workers'] -= 1
+            last_worker = remaining['workers'] == 0
+        if last_worker:
+            out_queue.put(_DONE)
+
+    @staticmethod
+    def _batch(first, in_queue, batch_size):
+        """`first` plus the items already waiting on `in_queue`, up to `batch_size` items."""
+        items = [first]
+        while len(items) < batch_size:
+            try:
+                item = in_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _DONE:
+                # Leave the end of the stream for the next get
+                in_queue.put(_DONE)
+                break
+            items.append(item)
+        return items
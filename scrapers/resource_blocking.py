@@ -0,0 +1,69 @@
+import logging
+from .utils import setup_logging
+
+logger = setup_logging('ResourceBlocking', level=logging.INFO)
+
+# URL patterns (CDP wildcards) of resources the scrapers never use
+MEDIA = ['*.mp4', '*.webm', '*.m3u8', '*.ts', '*.mp3', '*.ogg', '*.wav', '*.mov']
+FONTS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
+IMAGES = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico', '*.bmp']
+STYLESHEETS = ['*.css']
+# Analytics, advertising and session replay. Consent managers (OneTrust, Evidon, ...)
+# are left alone: several scrapers click their banners.
+TRACKERS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*googlesyndication.com*',
+    '*googleadservices.com*',
+    '*doubleclick.net*',
+    '*connect.facebook.net*',
+    '*facebook.com/tr*',
+    '*snap.licdn.com*',
+    '*px.ads.linkedin.com*',
+    '*bat.bing.com*',
+    '*clarity.ms*',
+    '*hotjar.com*',
+    '*hotjar.io*',
+    '*demdex.net*',
+    '*omtrdc.net*',
+    '*2o7.net*',
+    '*adsrvr.org*',
+    '*quantserve.com*',
+    '*scorecardresearch.com*',
+    '*newrelic.com*',
+    '*nr-data.net*',
+    '*mouseflow.com*',
+    '*crazyegg.com*',
+    '*taboola.com*',
+    '*outbrain.com*',
+    '*twitter.com/i/adsct*',
+    '*ads-twitter.com*',
+]
+
+# Blocking profiles a scraper can pick:
+# - 'off': load everything
+# - 'default': no media, web fonts or trackers; pages still render as in a normal
+#   browser, so printed PDFs keep their charts and layout
+# - 'text': also no images or stylesheets, for listing pages that are only parsed
+BLOCKING_PROFILES = {
+    'off': [],
+    'default': MEDIA + FONTS + TRACKERS,
+    'text': MEDIA + FONTS + TRACKERS + IMAGES + STYLESHEETS,
+}
+
+
+def blocked_urls(profile):
+    """URL patterns blocked by a profile name (None means 'off')."""
+    if profile is None:
+        return []
+    if profile not in BLOCKING_PROFILES:
+        raise ValueError(f"Unknown blocking profile '{profile}', expected one of {sorted(BLOCKING_PROFILES)}")
+    return BLOCKING_PROFILES[profile]
+
+
+def apply_blocking_profile(driver, profile):
+    """Make the browser fail every request matching the profile, from the next request on."""
+    urls = blocked_urls(profile)
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+    logger.debug(f"Blocking profile '{profile}': {len(urls)} URL patterns blocked")
@@ -3,51 +3,46 @@ from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
 
 from datetime import datetime
-import time
 from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
-import requests, os, base64
-import pandas as pd
+import os
 
 logger = setup_logging('SafraSarasin', level=logging.INFO)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'SafraSarasin'
+    # Cookie consent and the country selection are kept across runs
+    PERSIST_SESSION = True
     URL = 'https://jsafrasarasin.com/content/jsafrasarasin/language-masters/en/our-perspectives.html'
+    PDF_LINK_SELECTOR = "a.jss-btn__link[href*='https://publications.jsafrasarasin.com']"
     
     def __init__(self, headless=True):
         super().__init__('SafraSarasin', self.URL, headless=headless)
 
-    def fetch_articles(self):
+    def fetch_articles(self, retry=False):
+        from selenium.webdriver.common.by import By
         self.driver.get(self.URL)
-        time.sleep(4)
-        WebDriverWait(self.driver, 20).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "button.jss-cookieConsent__button.jss-cookieConsent__button--primary"))
-        ).click()
-        time.sleep(1)
-        input_field = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, ".autocomplete input[name='input__0']"))
-        )
-        input_field.click()
-        time.sleep(1)
-        input_field.send_keys("Switzerland")
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located((By.ID, "input__0"))
-        )
-        time.sleep(1)
-        self.driver.find_element(By.ID, "input__0").click()
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "button.jss-cmplf__btn"))
-        ).click()
-        time.sleep(5)
+        self.wait_for_document_ready()
+        if not self.has_consent():
+            self.wait_for_element(By.CSS_SELECTOR, "button.jss-cookieConsent__button.jss-cookieConsent__button--primary", condition='clickable').click()
+            input_field = self.wait_for_element(By.CSS_SELECTOR, ".autocomplete input[name='input__0']", timeout=10, condition='clickable')
+            input_field.click()
+            input_field.send_keys("Switzerland")
+            self.wait_for_element(By.ID, "input__0", timeout=10, condition='clickable').click()
+            self.wait_for_element(By.CSS_SELECTOR, "button.jss-cmplf__btn", timeout=10, condition='clickable').click()
+            self.record_consent()
+        # The cards are fetched and rendered after the page load (or the country selection)
+        self.wait_for_network_idle()
         page_source = self.driver.execute_script("return document.documentElement.outerHTML;")
     
         soup = BeautifulSoup(page_source, 'html.parser')
         items = soup.find_all('div', class_='jss-cHub--card white')
+        if not items and self.has_consent() and not retry:
+            # The site may no longer honour the restored session: select the country again, once
+            self.logger.warning("No articles with the restored session, going through the country selection again")
+            self.remove_cookies()
+            return self.fetch_articles(retry=True)
         
         return items
 
@@ -59,7 +54,7 @@ class MyScraper(BaseScraper):
         article_link = item.find('a', class_='jss-cHub--card__link')['href']
         article_link = urljoin(self.base_url, article_link)
         article_info = {
-            'Organization': 'SafraSarasin',
+            'Organization': self.ORGANIZATION,
             'Date': article_date,
             'Title': article_title.replace(' ', '_'),
             'Link': article_link,
@@ -68,36 +63,49 @@ class MyScraper(BaseScraper):
         article_info['file_name'] = sanitize_filename(f"{article_info['Date']}_{article_info['Organization']}_{article_info['Title']}.pdf")        
         return article_info
 
-    def download_pdf(self, article_info):       
+    def _find_pdf_link(self):
+        """URL of the PDF version of the loaded article, or None for an HTML-only article."""
+        from selenium.webdriver.common.by import By
+        links = self.driver.find_elements(By.CSS_SELECTOR, self.PDF_LINK_SELECTOR)
+        return links[0].get_attribute('href') if links else None
+
+    def _load_article(self, article_info):
         self.driver.get(article_info['Link'])
-        time.sleep(2)  # wait till loading finish
+        self.wait_for_document_ready()
+        # Looked up once: the archive stage reuses it instead of waiting for a link that never comes
+        article_info['pdf_link'] = self._find_pdf_link()
 
-        try:  # find the pdf link
-            link = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "a.jss-btn__link[href*='https://publications.jsafrasarasin.com']"))
-            )
-            link.click()
-            time.sleep(10)  # wait till download finish
-            self.rename_downloaded_file(article_info['file_name'])
+    def fetch_article_html(self, article_info):
+        # Articles with a PDF version are downloaded, the others are read from the page
+        # Unlike the other scrapers' pages this one needs the WebDriver, shared with the archive stage
+        with self._driver_lock:
+            self._load_article(article_info)
+            if article_info['pdf_link']:
+                return None
+            return self.driver.page_source
+
+    def download_pdf(self, article_info):
+        from selenium.webdriver.common.by import By
+        # fetch_article_html may have loaded the page already
+        if self.driver.current_url != article_info['Link'] or 'pdf_link' not in article_info:
+            self._load_article(article_info)
+
+        if not article_info['pdf_link']:
+            # No PDF version: print the page
+            self.capture_pdf(article_info['file_name'])
             return True
-            
-        except:  # otherwise print the page
-            result = self.driver.execute_cdp_cmd("Page.printToPDF", {
-                "landscape": False,
-                "displayHeaderFooter": False,
-                "printBackground": True,
-                "preferCSSPageSize": True,
-            })
-
-            pdf_base64 = result['data']
-            with open('tmp/data.pdf', 'wb') as f:
-                f.write(base64.b64decode(pdf_base64))
-                self.rename_downloaded_file(article_info['file_name'])
-                return True
+
+        link = self.wait_for_element(By.CSS_SELECTOR, self.PDF_LINK_SELECTOR, timeout=10, condition='clickable')
+        with self.track_download() as download:
+            link.click()
+            if not self.wait_for_download(download, timeout=60):
+                return False
+            download.save_as(self.download_path(article_info['file_name']))
+        return True
 
     
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -112,6 +120,7 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
 
 
 if __name__ == '__main__':
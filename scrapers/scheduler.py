@@ -0,0 +1,117 @@
+import json
+import logging
+import os
+import statistics
+from datetime import datetime
+from .utils import setup_logging
+
+logger = setup_logging('Scheduler', level=logging.INFO)
+
+HISTORY_FILE = os.path.join('state', 'scraper_history.json')
+# Runs kept per scraper
+MAX_RUNS = 60
+# Assumed duration of a scraper without history, in seconds. Unknown scrapers are
+# scheduled early, so a slow newcomer does not end up as the last job of the run.
+DEFAULT_DURATION = 300.0
+# Runs on a weekday, all without new articles, before that weekday counts as idle
+MIN_IDLE_RUNS = 3
+
+WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+class ScraperHistory:
+    """Duration, article yield and outcome of the past runs of every scraper."""
+
+    def __init__(self, path=HISTORY_FILE):
+        self.path = path
+        self.runs = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.runs = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Unable to read scraper history {path}: {e}")
+
+    def record(self, result, when=None):
+        """Add the result dict of one scraper run (module, status, articles, duration)."""
+        when = when or datetime.now()
+        runs = self.runs.setdefault(result['module'], [])
+        runs.append({
+            'date': when.strftime('%Y-%m-%d'),
+            'weekday': when.weekday(),
+            'status': result['status'],
+            'articles': result['articles'],
+            'duration': result['duration'],
+        })
+        del runs[:-MAX_RUNS]
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.runs, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def expected_duration(self, module):
+        """Median duration of the past runs, or DEFAULT_DURATION without history."""
+        durations = [run['duration'] for run in self.runs.get(module, [])]
+        return statistics.median(durations) if durations else DEFAULT_DURATION
+
+    def failure_rate(self, module):
+        runs = self.runs.get(module, [])
+        if not runs:
+            return 0.0
+        return sum(run['status'] != "Success" for run in runs) / len(runs)
+
+    def mean_yield(self, module):
+        runs = self.runs.get(module, [])
+        if not runs:
+            return None
+        return sum(run['articles'] for run in runs) / len(runs)
+
+    def idle_on(self, module, weekday):
+        """True if the scraper succeeded without a single new article on its last MIN_IDLE_RUNS runs on `weekday`."""
+        runs = [run for run in self.runs.get(module, []) if run['weekday'] == weekday][-MIN_IDLE_RUNS:]
+        return len(runs) == MIN_IDLE_RUNS and all(run['status'] == "Success" and run['articles'] == 0 for run in runs)
+
+
+def estimate_makespan(durations, workers):
+    """Wall time of running jobs of the given durations, in order, on `workers` workers."""
+    loads = [0.0] * max(1, workers)
+    for duration in durations:
+        idx = loads.index(min(loads))
+        loads[idx] += duration
+    return max(loads)
+
+
+def plan(scripts, history, workers, weekday=None, skip_idle=False):
+    """Order the scrapers to minimize the wall time of the run.
+
+    Longest expected duration first (LPT): the slow browser-bound scrapers start
+    right away and the cheap ones fill the gaps at the end. With `skip_idle`,
+    scrapers that never found anything new on this weekday are left out.
+    Returns (ordered scripts, skipped scripts).
+    """
+    weekday = datetime.now().weekday() if weekday is None else weekday
+    skipped = []
+    if skip_idle:
+        skipped = [script for script in scripts if history.idle_on(script, weekday)]
+        for script in skipped:
+            logger.info(f"Skipping {script}: no new articles on its last {MIN_IDLE_RUNS} runs on a {WEEKDAYS[weekday]}")
+
+    ordered = sorted((script for script in scripts if script not in skipped),
+                     key=lambda script: (-history.expected_duration(script), script))
+    for script in ordered:
+        mean_yield = history.mean_yield(script)
+        logger.info(
+            f"Scheduled {script}: expected {history.expected_duration(script):.0f}s, "
+            f"failure rate {history.failure_rate(script):.0%}, "
+            f"mean yield {'n/a' if mean_yield is None else f'{mean_yield:.1f}'} articles"
+        )
+
+    durations = [history.expected_duration(script) for script in ordered]
+    logger.info(
+        f"Estimated makespan on {workers} worker(s): {estimate_makespan(durations, workers):.0f}s "
+        f"(alphabetical order: {estimate_makespan([history.expected_duration(s) for s in sorted(ordered)], workers):.0f}s)"
+    )
+    return ordered, skipped
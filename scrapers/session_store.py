@@ -0,0 +1,86 @@
+import json
+import logging
+import os
+import time
+from .utils import setup_logging
+
+logger = setup_logging('SessionStore', level=logging.INFO)
+
+# Sessions live outside tmp/, which is wiped at the start of every run
+SESSION_DIR = os.path.join('state', 'sessions')
+# Seconds after which a session is dropped and the consent steps are clicked through again
+DEFAULT_MAX_AGE = 7 * 24 * 3600
+
+# Fields of a CDP Network.Cookie that Network.setCookies accepts back
+COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires', 'priority', 'sameParty', 'sourceScheme', 'partitionKey')
+
+
+def session_path(name):
+    """Local path of the session of the scraper workspace `name`."""
+    return os.path.join(os.getcwd(), SESSION_DIR, f'{name}.json')
+
+
+def restorable(cookies, now=None):
+    """CDP cookies as Network.setCookies parameters, without the expired ones.
+
+    Session cookies (no expiry) are kept: they carry the consent of some sites.
+    """
+    now = now or time.time()
+    params = []
+    for cookie in cookies:
+        expires = cookie.get('expires', -1)
+        if not cookie.get('session') and 0 < expires < now:
+            continue
+        param = {field: cookie[field] for field in COOKIE_FIELDS if field in cookie}
+        if cookie.get('session') or expires <= 0:
+            param.pop('expires', None)
+        params.append(param)
+    return params
+
+
+class SessionStore:
+    """Cookies of a site kept across runs, so that consent banners and country
+    selections are only clicked through once per `max_age` seconds.
+
+    Stored as JSON: {'created_at', 'saved_at', 'consent', 'cookies'} with the cookies in
+    CDP format. The age is counted from the first save, not the last one, so that a
+    session used every day still expires.
+    """
+
+    def __init__(self, path, max_age=DEFAULT_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self.created_at = None
+
+    def load(self):
+        """The stored session, or None if there is none or it has expired."""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path) as f:
+                session = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unable to read session {self.path}: {e}")
+            return None
+        age = time.time() - session.get('created_at', 0)
+        if age > self.max_age:
+            logger.info(f"Session {os.path.basename(self.path)} expired ({age / 3600:.0f}h old)")
+            self.clear()
+            return None
+        self.created_at = session['created_at']
+        return session
+
+    def save(self, cookies, consent=False):
+        now = time.time()
+        self.created_at = self.created_at or now
+        session = {'created_at': self.created_at, 'saved_at': now, 'consent': consent, 'cookies': cookies}
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(session, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        self.created_at = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
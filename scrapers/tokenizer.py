@@ -0,0 +1,97 @@
+import argparse
+import base64
+import hashlib
+import logging
+import os
+import threading
+from .utils import setup_logging
+
+logger = setup_logging('Tokenizer', level=logging.INFO)
+
+MODEL = "gpt-4o-mini"
+ENCODING = "o200k_base"
+VOCAB_URL = "https://openaipublic.blob.core.windows.net/encodings/o200k_base.tiktoken"
+VOCAB_SHA256 = "446a9538cb6c348e3516120d7c08b09f57c36495e2acfffe59a5bf8b0cfb1a2d"
+
+BUNDLED_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tiktoken_cache')
+
+# Split pattern and special tokens of o200k_base, as defined by tiktoken_ext.openai_public
+PAT_STR = "|".join([
+    r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]*[\p{Ll}\p{Lm}\p{Lo}\p{M}]+(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+    r"""[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]+[\p{Ll}\p{Lm}\p{Lo}\p{M}]*(?i:'s|'t|'re|'ve|'m|'ll|'d)?""",
+    r"""\p{N}{1,3}""",
+    r""" ?[^\s\p{L}\p{N}]+[\r\n/]*""",
+    r"""\s*[\r\n]+""",
+    r"""\s+(?!\S)""",
+    r"""\s+""",
+])
+SPECIAL_TOKENS = {"<|endoftext|>": 199999, "<|endofprompt|>": 200018}
+
+_enc = None
+_lock = threading.Lock()
+
+
+def bundled_vocab_path():
+    """Path of the bundled o200k_base vocabulary used by gpt-4o-mini."""
+    return os.path.join(BUNDLED_CACHE_DIR, f'{ENCODING}.tiktoken')
+
+
+def _load_ranks(path):
+    # Same format and parsing as tiktoken.load.load_tiktoken_bpe: "<base64 token> <rank>" per line
+    with open(path, 'rb') as f:
+        return {base64.b64decode(token): int(rank) for token, rank in (line.split() for line in f if line.strip())}
+
+
+def get_encoder():
+    """Process-wide tiktoken encoder for gpt-4o-mini.
+
+    Built once, on first use, straight from the bundled vocabulary file when it is
+    present (no network, no tiktoken cache); every module shares the same instance.
+    """
+    global _enc
+    if _enc is None:
+        with _lock:
+            if _enc is None:
+                import tiktoken
+
+                path = bundled_vocab_path()
+                if os.path.exists(path):
+                    _enc = tiktoken.Encoding(name=ENCODING, pat_str=PAT_STR, mergeable_ranks=_load_ranks(path),
+                                             special_tokens=SPECIAL_TOKENS)
+                else:
+                    logger.warning(f"Bundled tokenizer vocabulary not found at {path}, tiktoken will download it "
+                                   f"(run python -m scrapers.tokenizer --bundle)")
+                    _enc = tiktoken.encoding_for_model(MODEL)
+    return _enc
+
+
+def preload_encoder():
+    """Build the encoder in a background thread, so it is ready by the time the first article needs it."""
+    if _enc is None:
+        threading.Thread(target=get_encoder, name='tokenizer-preload', daemon=True).start()
+
+
+def bundle_vocab():
+    """Download the vocabulary into the bundled directory (run once at build time)."""
+    from .http_session import get_http_session
+
+    response = get_http_session().get(VOCAB_URL, timeout=(10, 120))
+    response.raise_for_status()
+    if hashlib.sha256(response.content).hexdigest() != VOCAB_SHA256:
+        raise ValueError(f"Unexpected checksum for {VOCAB_URL}")
+    os.makedirs(BUNDLED_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{bundled_vocab_path()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(response.content)
+    os.replace(tmp_path, bundled_vocab_path())
+    logger.info(f"Tokenizer vocabulary bundled at {bundled_vocab_path()}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Manage the bundled tokenizer vocabulary')
+    parser.add_argument("--bundle", action='store_true', help="Download the vocabulary into the bundled directory")
+    args = parser.parse_args()
+
+    if args.bundle:
+        bundle_vocab()
+    else:
+        print(bundled_vocab_path(), 'present' if os.path.exists(bundled_vocab_path()) else 'missing')
@@ -1,38 +1,41 @@
 from .base_scraper import BaseScraper
 from .utils import sanitize_filename, setup_logging, logging
 from .macro_handler import S3MacroManager
+from .async_runner import run_scraper
 
 from datetime import datetime
-import time
-from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium import webdriver
 
-import pandas as pd
-import requests, re, base64 
+import re
 
 logger = setup_logging('Troweprice', level=logging.INFO)
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'Troweprice'
     URL = 'https://www.troweprice.com/personal-investing/resources/insights/all-insights.html'
     
     def __init__(self, headless=True):
         super().__init__('Troweprice', 'https://www.troweprice.com', headless=headless)
 
     def fetch_articles(self):
-        response = requests.get(self.URL)
+        response = self.http.get(self.URL, timeout=self.HTTP_TIMEOUT)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            articles= []
-            content_boxes = soup.find_all(class_=['content-box-holder'])
-            for box in content_boxes:
-                if 'markets & economy' in box.get_text():
-                    articles.append(box)
-            return articles
+            return self._parse_listing(response.text)
+
+    async def afetch_articles(self, http):
+        response = await http.get(self.URL)
+        if response.status_code == 200:
+            return self._parse_listing(response.text)
+
+    def _parse_listing(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+        articles= []
+        content_boxes = soup.find_all(class_=['content-box-holder'])
+        for box in content_boxes:
+            if 'markets & economy' in box.get_text():
+                articles.append(box)
+        return articles
 
     def extract_article_info(self, box):
         match = re.search(r'([a-zA-Z]+)\s(\d{1,2}),\s(\d{4})', box.get_text())
@@ -52,7 +55,7 @@ class MyScraper(BaseScraper):
                     if description_div and description_div.find('div', {'class': 'paragraph-contents'})
                     else "")
         article_info = {
-            'Organization': 'Troweprice',
+            'Organization': self.ORGANIZATION,
             'Date': date_text,
             'Title': title.replace(' ', '_'),
             'Link': full_url,
@@ -62,25 +65,21 @@ class MyScraper(BaseScraper):
         article_info['file_name'] = sanitize_filename(f"{article_info['Date']}_{article_info['Organization']}_{article_info['Title']}.pdf")        
         return article_info
 
+    def fetch_article_html(self, article_info):
+        return self.fetch_html(article_info['Link'])
+
+    async def afetch_article_html(self, http, article_info):
+        return await self.afetch_html(http, article_info['Link'])
+
     def download_pdf(self, article_info):
-        time.sleep(1)  
-        pdf_response = requests.get(article_info['Link'])
         self.driver.get(article_info['Link'])
-        time.sleep(2)  # wait till loading finish
-        result = self.driver.execute_cdp_cmd("Page.printToPDF", {
-            "landscape": False,
-            "displayHeaderFooter": False,
-            "printBackground": True,
-            "preferCSSPageSize": True,
-        })
-        pdf_base64 = result['data']
-        with open('tmp/data.pdf', 'wb') as f:
-            f.write(base64.b64decode(pdf_base64))
-
-        self.rename_downloaded_file( article_info['file_name'] )
+        self.wait_for_network_idle()  # wait till loading finish
+        self.capture_pdf(article_info['file_name'])
+
         return True
     
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -95,6 +94,12 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
+
+
+async def amain(date_from, http, llm, overwrite=False):
+    """Async entry point used by run_scrapers --async-http."""
+    return await run_scraper(lambda date_from: MyScraper(headless=True), date_from, http, llm, overwrite)
 
 
 if __name__ == '__main__':
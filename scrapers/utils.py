@@ -2,13 +2,8 @@ import logging
 import os, json
 from datetime import datetime
 from unidecode import unidecode
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_openai import ChatOpenAI
-import tiktoken
-enc = tiktoken.encoding_for_model("gpt-4o-mini")
 
 import logging
-from .llm_functions import clean_article
 
 def setup_logging(logger_name, level=logging.INFO, log_file='error.log'):
     logger = logging.getLogger(logger_name)
@@ -77,6 +72,8 @@ def parse_text_from_pdf(file_path):
         return ""
 
     try:
+        from langchain_community.document_loaders import PyPDFLoader
+
         loader = PyPDFLoader(file_path)
         pages = loader.load_and_split()
 
@@ -104,6 +101,8 @@ def parse_text_from_pdf(file_path):
 
 def isMacro(text, max_chunk_tokens=125000):
     from langchain.prompts import PromptTemplate
+    from langchain_openai import ChatOpenAI
+    from .tokenizer import get_encoder
 
     params = {'filter_macro': {
         'prompt': (
@@ -117,7 +116,7 @@ def isMacro(text, max_chunk_tokens=125000):
         }
 
     # Initialize tokenizer
-    tokenizer = enc  # Tiktoken tokenizer initialized earlier
+    tokenizer = get_encoder()
 
     # Tokenize the text
     tokens = tokenizer.encode(text)
@@ -145,6 +144,8 @@ def isMacro(text, max_chunk_tokens=125000):
         return False
     
 def get_content_and_summary(file_name):
+    from .llm_functions import clean_article
+
     DOWNLOAD_DIR = os.path.join(os.getcwd(), 'tmp')
     context = parse_text_from_pdf(DOWNLOAD_DIR +'/'+ file_name)
     if isMacro(context):
@@ -6,11 +6,6 @@ from datetime import datetime
 from urllib.parse import urljoin
 import argparse
 from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver import ActionChains
-import pandas as pd
 import os
 
 from .utils import parse_text_from_pdf
@@ -21,6 +16,7 @@ logger = setup_logging('WisdomTree', level=logging.INFO)
 local_db_path = 'local_db/wisdom_tree'
 
 class MyScraper(BaseScraper):
+    ORGANIZATION = 'WisdomTree'
     URL = 'https://www.wisdomtree.com/us/en/insights/all-insights'
     
     def __init__(self, headless=True):
@@ -58,7 +54,7 @@ class MyScraper(BaseScraper):
 
         article_info_from_pdf = extract_article_info_from_pdf(text)
         article_info = {
-            'Organization': 'WisdomTree',
+            'Organization': self.ORGANIZATION,
             'Date': article_info_from_pdf['Date'],
             'Title': article_info_from_pdf['Title'].replace(' ', '_'),
             'Link': article["PostUrl"],
@@ -71,7 +67,7 @@ class MyScraper(BaseScraper):
         # Copy the PDF file
         try:
             source_path = article_info['Link'].replace('file://', '')
-            destination_path = os.path.join('tmp', article_info['file_name'])
+            destination_path = self.download_path(article_info['file_name'])
             shutil.copy2(source_path, destination_path)
         except IOError as e:
             self.logger.error(f"Failed to copy PDF from {source_path} to {destination_path}: {e}")
@@ -81,6 +77,7 @@ class MyScraper(BaseScraper):
         return True
     
 def main(date_from, headless=False, overwrite=False ):
+    import pandas as pd
 
     try:
         date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime("%Y-%m-%d")
@@ -95,6 +92,7 @@ def main(date_from, headless=False, overwrite=False ):
     scraper.store_articles(new_articles)
     
     logger.info(f"Completed with {len(new_articles)} new articles.")
+    return len(new_articles)
 
 
 if __name__ == '__main__':